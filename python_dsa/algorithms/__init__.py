@@ -1,10 +1,18 @@
 from python_dsa.algorithms.binary_search import *
+from python_dsa.algorithms.breadth_first_paths import *
+from python_dsa.algorithms.chunking import *
+from python_dsa.algorithms.cutoff_calibration import *
 from python_dsa.algorithms.depth_first_order import *
 from python_dsa.algorithms.depth_first_order_recursive import *
 from python_dsa.algorithms.directed_cycle import *
 from python_dsa.algorithms.djikstra import *
+from python_dsa.algorithms.external_sort import *
+from python_dsa.algorithms.eytzinger import *
+from python_dsa.algorithms.instrumentation import *
 from python_dsa.algorithms.prim import PrimMST
+from python_dsa.algorithms.radix_sort import *
 from python_dsa.algorithms.sorting import *
 from python_dsa.algorithms.strings import *
+from python_dsa.algorithms.suffix_array import *
 from python_dsa.algorithms.topological_sort import *
 
@@ -0,0 +1,297 @@
+# Reproducible benchmarks for the sorts in sorting.py and searches in binary_search.py.
+import argparse
+import dataclasses
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+
+from python_dsa.algorithms.binary_search import (exponential_search, interpolation_search,
+                                                 iterative_binary_search)
+from python_dsa.algorithms.instrumentation import instrumented
+from python_dsa.algorithms.sorting import (bottom_up_merge_sort, heap_sort, heapq_sort, hybrid_sort,
+                                           insertion_sort, merge_sort, quick_sort, selection_sort,
+                                           shell_sort, three_way_quick_sort)
+
+
+def _builtin_sort(seq):
+    """list.sort, as a baseline for the other sorts."""
+    seq.sort()
+    return seq
+
+
+SORTS = {
+    "sorted": _builtin_sort,
+    "selection_sort": selection_sort,
+    "insertion_sort": insertion_sort,
+    "shell_sort": shell_sort,
+    "merge_sort": merge_sort,
+    "bottom_up_merge_sort": bottom_up_merge_sort,
+    "quick_sort": quick_sort,
+    "three_way_quick_sort": three_way_quick_sort,
+    "heap_sort": heap_sort,
+    "heapq_sort": heapq_sort,
+    "hybrid_sort": hybrid_sort,
+}
+
+
+def _random(size, rng):
+    return [rng.randint(0, 10**9) for _ in range(size)]
+
+
+def _sorted(size, rng):
+    return list(range(size))
+
+
+def _reversed(size, rng):
+    return list(range(size, 0, -1))
+
+
+def _few_unique(size, rng):
+    return [rng.randint(0, 9) for _ in range(size)]
+
+
+def _organ_pipe(size, rng):
+    return list(range(size // 2)) + list(range(size - size // 2, 0, -1))
+
+
+def _partially_sorted(size, rng):
+    """Sorted, apart from one in ten elements which are moved to a random index."""
+    seq = list(range(size))
+    for _ in range(size // 10):
+        seq[rng.randrange(size)] = rng.randrange(size)
+    return seq
+
+
+DISTRIBUTIONS = {
+    "random": _random,
+    "sorted": _sorted,
+    "reversed": _reversed,
+    "few_unique": _few_unique,
+    "organ_pipe": _organ_pipe,
+    "partially_sorted": _partially_sorted,
+}
+
+
+def _count_operations(sort, seq):
+    """Run sort once with instrumentation and return its operation counts."""
+    counted_sort = instrumented(sort)
+    counted_sort(seq.copy())
+    operations = dataclasses.asdict(counted_sort.stats)
+    # list.sort and heapq work on the list's storage directly so their moves can't be observed.
+    if sort in (_builtin_sort, heapq_sort):
+        operations["moves"] = None
+    return operations
+
+
+def _percentile(sorted_values, percent):
+    """Nearest rank percentile of already sorted values."""
+    return sorted_values[max(0, math.ceil(percent / 100 * len(sorted_values)) - 1)]
+
+
+def run(sorts=tuple(SORTS), distributions=tuple(DISTRIBUTIONS), sizes=(1000,), repeats=5, seed=0):
+    """Benchmark each sort on each distribution and size, returning a list of result dicts.
+
+    Each input is generated from seed so runs are reproducible. The sort is timed on a fresh copy of
+    the input repeats times, and operations are counted in a separate, untimed run so that counting
+    doesn't affect the timings.
+    """
+    results = []
+    for distribution in distributions:
+        for size in sizes:
+            seq = DISTRIBUTIONS[distribution](size, random.Random(f"{seed}-{distribution}-{size}"))
+            for name in sorts:
+                sort = SORTS[name]
+                times = []
+                for _ in range(repeats):
+                    copy = seq.copy()
+                    start = time.perf_counter()
+                    result = sort(copy)
+                    times.append(time.perf_counter() - start)
+
+                if result != sorted(seq):
+                    raise AssertionError(f"{name} did not sort {distribution} input of size {size}")
+
+                # The quicksorts shuffle with the global random generator. Seed it so that their
+                # operation counts are reproducible too.
+                random.seed(seed)
+                operations = _count_operations(sort, seq)
+
+                times.sort()
+                results.append({
+                    "sort": name,
+                    "distribution": distribution,
+                    "size": size,
+                    "repeats": repeats,
+                    "min": times[0],
+                    "median": statistics.median(times),
+                    "p95": _percentile(times, 95),
+                    **operations,
+                })
+
+    return results
+
+
+SEARCHES = {
+    "binary_search": iterative_binary_search,
+    "exponential_search": exponential_search,
+    "interpolation_search": interpolation_search,
+}
+
+
+def _uniform_keys(size, rng):
+    return sorted(rng.sample(range(size * 10), size))
+
+
+def _timestamp_keys(size, rng):
+    """Increasing timestamps with exponentially distributed gaps, i.e. roughly uniform."""
+    keys, timestamp = [], 1_600_000_000_000
+    for _ in range(size):
+        timestamp += int(rng.expovariate(1 / 1000)) + 1
+        keys.append(timestamp)
+    return keys
+
+
+def _skewed_keys(size, rng):
+    """Heavy tailed keys, the worst case for interpolation search."""
+    return sorted(int(rng.paretovariate(0.5)) for _ in range(size))
+
+
+def _clustered_keys(size, rng):
+    """A few dense clusters of keys separated by large gaps."""
+    centres = [rng.randrange(10**12) for _ in range(8)]
+    return sorted(rng.choice(centres) + rng.randrange(size) for _ in range(size))
+
+
+SEARCH_DISTRIBUTIONS = {
+    "uniform": _uniform_keys,
+    "timestamps": _timestamp_keys,
+    "skewed": _skewed_keys,
+    "clustered": _clustered_keys,
+}
+
+
+class _ProbedList(list):
+    """A list that counts how many times its elements are read."""
+
+    def __init__(self, values):
+        super().__init__(values)
+        self.probes = 0
+
+    def __getitem__(self, idx):
+        self.probes += 1
+        return super().__getitem__(idx)
+
+
+def run_search(searches=tuple(SEARCHES), distributions=tuple(SEARCH_DISTRIBUTIONS), sizes=(10**5,),
+               queries=1000, repeats=5, seed=0):
+    """Benchmark each search on each key distribution and size, returning a list of result dicts.
+
+    Half of the queries are keys in the sequence and half are random values within its range. Times
+    are for the whole batch of queries, and probes is the mean number of elements read per query.
+    """
+    results = []
+    for distribution in distributions:
+        for size in sizes:
+            rng = random.Random(f"{seed}-{distribution}-{size}")
+            seq = SEARCH_DISTRIBUTIONS[distribution](size, rng)
+            hits = [rng.choice(seq) for _ in range(queries // 2)]
+            elems = hits + [rng.randint(seq[0], seq[-1]) for _ in range(queries - len(hits))]
+            hits = set(hits)
+            for name in searches:
+                search = SEARCHES[name]
+                times = []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    for elem in elems:
+                        search(seq, elem)
+                    times.append(time.perf_counter() - start)
+
+                probed = _ProbedList(seq)
+                for elem in elems:
+                    if search(probed, elem) == -1 and elem in hits:
+                        raise AssertionError(f"{name} did not find {elem} in {distribution} keys")
+
+                times.sort()
+                results.append({
+                    "search": name,
+                    "distribution": distribution,
+                    "size": size,
+                    "queries": queries,
+                    "repeats": repeats,
+                    "min": times[0],
+                    "median": statistics.median(times),
+                    "p95": _percentile(times, 95),
+                    "probes": probed.probes / queries,
+                })
+
+    return results
+
+
+def _print_table(results, columns):
+    """Print results as a table of the given columns, with the first two left aligned."""
+    print("".join(f"{column:<22}" if idx < 2 else f"{column:>14}"
+                  for idx, column in enumerate(columns)))
+    for result in results:
+        print("".join(f"{result[column]:<22}" if idx < 2
+                      else f"{result[column]:>14.6f}" if isinstance(result[column], float)
+                      else f"{str(result[column]):>14}"
+                      for idx, column in enumerate(columns)))
+
+
+def main(argv=None):
+    # Options shared by every benchmark, given after its name.
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--seed", type=int, default=0)
+    common.add_argument("--repeats", type=int, default=5)
+    common.add_argument("--output", help="Write results as JSON to this path ('-' for stdout).")
+
+    parser = argparse.ArgumentParser(description="Benchmark the sorts and searches in python_dsa.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    sort_parser = subparsers.add_parser("sort", parents=[common], help="Benchmark sorts.")
+    sort_parser.add_argument("--sorts", nargs="+", choices=SORTS, default=list(SORTS))
+    sort_parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS,
+                             default=list(DISTRIBUTIONS))
+    sort_parser.add_argument("--sizes", nargs="+", type=int, default=[1000])
+
+    search_parser = subparsers.add_parser("search", parents=[common],
+                                          help="Benchmark searches of sorted keys.")
+    search_parser.add_argument("--searches", nargs="+", choices=SEARCHES, default=list(SEARCHES))
+    search_parser.add_argument("--distributions", nargs="+", choices=SEARCH_DISTRIBUTIONS,
+                               default=list(SEARCH_DISTRIBUTIONS))
+    search_parser.add_argument("--sizes", nargs="+", type=int, default=[10**5])
+    search_parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    if args.benchmark == "sort":
+        results = run(args.sorts, args.distributions, args.sizes, args.repeats, args.seed)
+        columns = ("sort", "distribution", "size", "min", "median", "p95", "compares", "moves",
+                   "aux_bytes", "max_depth")
+    else:
+        results = run_search(args.searches, args.distributions, args.sizes, args.queries,
+                             args.repeats, args.seed)
+        columns = ("search", "distribution", "size", "min", "median", "p95", "probes")
+
+    if args.output:
+        report = {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "results": results,
+        }
+        if args.output == "-":
+            json.dump(report, sys.stdout, indent=2)
+        else:
+            with open(args.output, "w") as output_file:
+                json.dump(report, output_file, indent=2)
+        return
+
+    _print_table(results, columns)
+
+
+if __name__ == "__main__":
+    main()
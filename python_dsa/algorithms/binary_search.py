@@ -1,5 +1,14 @@
 # Binary search implementation (assuming pre-sorted subscriptable sequence)
 import bisect
+import mmap
+import os
+
+from python_dsa.algorithms.sorting import _numeric_typecode
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def binary_search(seq, elem):
@@ -40,6 +49,215 @@ def recursive_binary_search(seq, elem, lo, hi):
         return idx
 
 
+# O(logi) where i is the index of elem, so faster than binary search for elems near the start.
+def exponential_search(seq, elem):
+    """Double a bound until it passes elem, then binary search below it. Return -1 if not found."""
+    bound = 1
+    while bound < len(seq) and seq[bound] < elem:
+        bound *= 2
+
+    idx = bisect.bisect_left(seq, elem, bound // 2, min(bound + 1, len(seq)))
+    if idx != len(seq) and seq[idx] == elem:
+        return idx
+    return -1
+
+
+# O(loglogn) probes on average for uniformly distributed numeric keys. O(logn) worst case.
+def interpolation_search(seq, elem):
+    """Probe where elem would be if seq were spread evenly. Return -1 if not found."""
+    lo, hi = 0, len(seq) - 1
+    if hi < 0:
+        return -1
+
+    lo_elem, hi_elem = seq[lo], seq[hi]
+    interpolate = True
+    while lo <= hi and lo_elem <= elem <= hi_elem:
+        if lo_elem == hi_elem:
+            return lo
+
+        # elem is within [lo_elem, hi_elem] so the ratio is within [0, 1] and idx within [lo, hi].
+        if interpolate:
+            idx = lo + int((elem - lo_elem) / (hi_elem - lo_elem) * (hi - lo))
+        else:
+            idx = (lo + hi) // 2
+
+        size = hi - lo
+        idx_elem = seq[idx]
+        if idx_elem < elem:
+            lo = idx + 1
+            if lo > hi:
+                break
+            lo_elem = seq[lo]
+        elif idx_elem > elem:
+            hi = idx - 1
+            if lo > hi:
+                break
+            hi_elem = seq[hi]
+        else:
+            return idx
+
+        # On skewed keys interpolation can creep forward a few elements at a time. Bisect whenever
+        # a probe fails to at least halve the range, which bounds the worst case to O(logn).
+        interpolate = hi - lo <= size // 2
+
+    return -1
+
+
+def _as_ndarray(seq):
+    """Return seq as a numpy array if it is one or is homogeneous and numeric, otherwise None."""
+    # Arrays are used as they are rather than converted on every call.
+    if isinstance(seq, np.ndarray):
+        return seq
+    typecode = _numeric_typecode(seq)
+    return None if typecode is None else np.asarray(seq, dtype=typecode)
+
+
+# O(mlog(n/m) + mlogm) for m elems, instead of O(mlogn) for m separate searches.
+def batch_bisect_left(seq, elems):
+    """Return bisect.bisect_left(seq, elem) for each of elems, in the order elems were given."""
+    # len() rather than truth values, which numpy arrays don't have.
+    if np is not None and len(elems) and len(seq):
+        seq_array, elems_array = _as_ndarray(seq), _as_ndarray(elems)
+        if seq_array is not None and elems_array is not None:
+            return np.searchsorted(seq_array, elems_array).tolist()
+
+    positions = [0] * len(elems)
+    # Visiting elems in sorted order means each search can start where the previous one ended.
+    lo = 0
+    for elem_idx in sorted(range(len(elems)), key=elems.__getitem__):
+        elem = elems[elem_idx]
+        if lo < len(seq) and seq[lo] < elem:
+            # Gallop: double the step until it passes elem, then bisect within the last step.
+            step = 1
+            while lo + step < len(seq) and seq[lo + step] < elem:
+                step *= 2
+            lo = bisect.bisect_left(seq, elem, lo + step // 2 + 1, min(lo + step, len(seq)))
+        positions[elem_idx] = lo
+
+    return positions
+
+
+def batch_binary_search(seq, elems):
+    """Return the index of each of elems in seq, or -1 for those that are not in seq."""
+    return [idx if idx != len(seq) and seq[idx] == elem else -1
+            for elem, idx in zip(elems, batch_bisect_left(seq, elems))]
+
+
+class _MappedFile:
+    """Read only memory map of a file, opened on construction and closed on exit or close()."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        # Empty files can't be mapped, but empty bytes support the same reads.
+        self._map = (mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size
+                     else b"")
+
+    def close(self):
+        if self.size:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RecordFileSearch(_MappedFile):
+    """Binary search a file of sorted fixed width binary records without reading it into memory.
+
+    key(record) gives the sort key of a record's bytes, e.g. lambda record: record[:8] for records
+    that start with a big endian 8 byte ID. Defaults to the whole record.
+    """
+
+    def __init__(self, path, record_size, key=None):
+        super().__init__(path)
+        self.record_size = record_size
+        self.key = key or (lambda record: record)
+
+    def __len__(self):
+        return self.size // self.record_size
+
+    def __getitem__(self, idx):
+        if not 0 <= idx < len(self):
+            raise IndexError("Record index out of range")
+        return self._map[idx * self.record_size : (idx + 1) * self.record_size]
+
+    def _lower_bound(self, key):
+        """Return the index of the first record whose key is at least key (or len(self))."""
+        lo, hi = 0, len(self)
+        while lo < hi:
+            idx = (hi + lo) // 2
+            if self.key(self[idx]) < key:
+                lo = idx + 1
+            else:
+                hi = idx
+        return lo
+
+    def find(self, key):
+        """Return the byte offset of the first record with key, or -1 if there isn't one."""
+        idx = self._lower_bound(key)
+        if idx != len(self) and self.key(self[idx]) == key:
+            return idx * self.record_size
+        return -1
+
+    def range(self, lo_key, hi_key):
+        """Yield (offset, record) for every record with lo_key <= key < hi_key, in order."""
+        for idx in range(self._lower_bound(lo_key), self._lower_bound(hi_key)):
+            yield idx * self.record_size, self[idx]
+
+
+class LineFileSearch(_MappedFile):
+    """Binary search a file of sorted newline delimited lines without reading it into memory.
+
+    key(line) gives the sort key of a line's bytes (without the newline). Defaults to the whole line.
+    Probes land at arbitrary byte offsets, so each one seeks back to the start of its line.
+    """
+
+    def __init__(self, path, key=None):
+        super().__init__(path)
+        self.key = key or (lambda line: line)
+
+    def line_at(self, offset):
+        """Return the line starting at offset, without its newline."""
+        end = self._map.find(b"\n", offset)
+        return self._map[offset : self.size if end == -1 else end]
+
+    def lower_bound(self, key):
+        """Return the byte offset of the first line whose key is at least key (or the file size)."""
+        # lo is always the start of a line and the answer is always in [lo, hi].
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (hi + lo) // 2
+            start = self._map.rfind(b"\n", lo, mid)
+            start = lo if start == -1 else start + 1
+            line = self.line_at(start)
+            if self.key(line) < key:
+                lo = min(start + len(line) + 1, self.size)
+            else:
+                hi = start
+        return lo
+
+    def find(self, key):
+        """Return the byte offset of the first line with key, or -1 if there isn't one."""
+        offset = self.lower_bound(key)
+        if offset != self.size and self.key(self.line_at(offset)) == key:
+            return offset
+        return -1
+
+    def range(self, lo_key, hi_key):
+        """Yield (offset, line) for every line with lo_key <= key < hi_key, in order."""
+        offset = self.lower_bound(lo_key)
+        while offset < self.size:
+            line = self.line_at(offset)
+            if not self.key(line) < hi_key:
+                return
+            yield offset, line
+            offset += len(line) + 1
+
+
 if __name__ == "__main__":
     arr = list(range(10))
     print(arr)
@@ -83,3 +301,25 @@ if __name__ == "__main__":
     print(recursive_binary_search(arr, 53, 0, len(arr)))
     print(recursive_binary_search(arr, 54, 0, len(arr)))
 
+    print("Starting exponential search")
+    print(exponential_search(arr, 6))
+    print(exponential_search(arr, 53))
+    print(exponential_search(arr, 54))
+
+    print("Starting interpolation search")
+    print(interpolation_search(arr, 6))
+    print(interpolation_search(arr, 53))
+    print(interpolation_search(arr, 54))
+
+    print("Starting batch search")
+    print(batch_binary_search(arr, [53, 6, 54, 1, -5, 15, 6]))
+
+    print("Starting memory-mapped file search")
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "sorted.txt")
+        with open(path, "wb") as sorted_file:
+            sorted_file.write(b"".join(b"%d\n" % elem for elem in arr))
+        with LineFileSearch(path, key=int) as searcher:
+            print(searcher.find(10), searcher.find(11))
+            print(list(searcher.range(4, 15)))
@@ -0,0 +1,243 @@
+# Shortest hop paths by breadth first search: direction optimising, multi-source and bit-parallel.
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from python_dsa.graph.csr_graph import CSRGraph
+from python_dsa.graph.directed_graph import DiGraph
+from python_dsa.graph.directed_graph_recursive import DiGraphRecursive
+from python_dsa.graph.undirected_graph import Graph
+
+
+def _is_directed(graph):
+    return getattr(graph, "directed", isinstance(graph, (DiGraph, DiGraphRecursive)))
+
+
+def _unvisited(visited):
+    """Yield the vertices that aren't marked in visited, skipping marked runs in C with find."""
+    vertex = visited.find(0)
+    while vertex != -1:
+        yield vertex
+        vertex = visited.find(0, vertex + 1)
+
+
+class BreadthFirstPaths:
+    """Distances and BFS tree parents of every vertex from the nearest source, a level at a time.
+
+    Each level's frontier is expanded in one of two ways (Beamer, Asanovic and Patterson, 2012):
+
+    - Top down, every edge out of the frontier is followed to find unvisited vertices. Vertices are
+      marked when they are found, so each is queued once.
+    - Bottom up, every unvisited vertex looks through its edges in for one from the frontier, and
+      stops at the first. Once the frontier covers a large part of the graph most of the top down
+      edges lead to visited vertices, so this does far less work on low diameter graphs.
+
+    The search goes bottom up when the edges out of the frontier outnumber the edges of the
+    unvisited vertices divided by alpha, and back to top down once the frontier is smaller than
+    the number of vertices divided by beta, and alpha=0 keeps it top down. Directed graphs need
+    their reverse for bottom up steps, so they only take them if reverse_graph is given. Building
+    it costs more than one search saves, so make it once with graph.reverse() and reuse it.
+
+    sources is a vertex or an iterable of vertices, which all start in the first frontier.
+    distances[v] is the number of edges on a shortest path to v from any source and parents[v] the
+    vertex before v on it, both -1 for vertices that can't be reached (and parents of sources are
+    -1).
+    """
+
+    def __init__(self, graph, sources, reverse_graph=None, alpha=14, beta=24):
+        num_vertices = graph.num_vertices
+        self.sources = [sources] if isinstance(sources, int) else list(dict.fromkeys(sources))
+        self.distances = array("l", [-1]) * num_vertices
+        self.parents = array("l", [-1]) * num_vertices
+
+        adj = graph.adj
+        if not _is_directed(graph):
+            in_adj = adj
+        elif reverse_graph is not None:
+            in_adj = reverse_graph.adj
+        else:
+            in_adj = None
+
+        # A byte per vertex rather than a set of boxed ints.
+        visited = bytearray(num_vertices)
+        for source in self.sources:
+            visited[source] = True
+            self.distances[source] = 0
+        frontier = self.sources
+        degrees = [len(neighbours) for neighbours in adj]
+        unvisited_edges = sum(degrees) - sum(degrees[source] for source in frontier)
+        bottom_up = False
+
+        level = 0
+        while frontier:
+            level += 1
+            frontier_edges = sum(degrees[vertex] for vertex in frontier)
+            if not bottom_up and in_adj is not None and frontier_edges * alpha > unvisited_edges:
+                bottom_up = True
+            elif bottom_up and len(frontier) < num_vertices / beta:
+                bottom_up = False
+
+            if bottom_up:
+                frontier = self._bottom_up_step(in_adj, visited, level)
+            else:
+                frontier = self._top_down_step(adj, visited, frontier, level)
+            unvisited_edges -= sum(degrees[vertex] for vertex in frontier)
+
+    def _top_down_step(self, adj, visited, frontier, level):
+        """Return the next frontier, found by following the edges out of the frontier."""
+        distances, parents = self.distances, self.parents
+        next_frontier = []
+        for vertex in frontier:
+            for adjacent_vertex in adj[vertex]:
+                if not visited[adjacent_vertex]:
+                    visited[adjacent_vertex] = True
+                    distances[adjacent_vertex] = level
+                    parents[adjacent_vertex] = vertex
+                    next_frontier.append(adjacent_vertex)
+        return next_frontier
+
+    def _bottom_up_step(self, in_adj, visited, level):
+        """Return the next frontier, found by checking the unvisited vertices' edges in."""
+        distances, parents = self.distances, self.parents
+        next_frontier = []
+        # Vertices found in this step are only marked afterwards, so that the check below only
+        # matches vertices of the current frontier.
+        for vertex in _unvisited(visited):
+            for adjacent_vertex in in_adj[vertex]:
+                if distances[adjacent_vertex] == level - 1:
+                    distances[vertex] = level
+                    parents[vertex] = adjacent_vertex
+                    next_frontier.append(vertex)
+                    break
+        for vertex in next_frontier:
+            visited[vertex] = True
+        return next_frontier
+
+    def has_path_to(self, vertex):
+        return self.distances[vertex] != -1
+
+    def distance_to(self, vertex):
+        """Return the number of edges on a shortest path from any source to vertex, or -1."""
+        return self.distances[vertex]
+
+    def path_to(self, vertex):
+        """Return the vertices on a shortest path from the nearest source to vertex, or None."""
+        if not self.has_path_to(vertex):
+            return None
+        path = [vertex]
+        while self.parents[vertex] != -1:
+            vertex = self.parents[vertex]
+            path.append(vertex)
+        return path[::-1]
+
+
+# O(levels * (V + E)) big int operations, each O(len(sources) / 30), plus O(len(sources) * V) to
+# write distances.
+def _bit_parallel_bfs(graph, sources, distances=None):
+    """Search from every one of sources at once, with bit idx of each mask standing for source idx.
+
+    Each vertex has a mask of the sources that have reached it, and the frontier maps vertices to
+    the sources that reached them in the last level. An edge passes all of its vertex's frontier
+    sources along in one big int operation, so searches that reach a vertex at the same level share
+    the work of following its edges. Returns the masks, and fills distances[idx] with the distances
+    from sources[idx] if given.
+    """
+    adj = graph.adj
+    reached = [0] * graph.num_vertices
+    frontier = {}
+    for idx, source in enumerate(sources):
+        reached[source] |= 1 << idx
+        frontier[source] = frontier.get(source, 0) | 1 << idx
+        if distances is not None:
+            distances[idx][source] = 0
+
+    level = 0
+    while frontier:
+        level += 1
+        next_frontier = {}
+        for vertex, bits in frontier.items():
+            for adjacent_vertex in adj[vertex]:
+                new_bits = bits & ~reached[adjacent_vertex]
+                if new_bits:
+                    reached[adjacent_vertex] |= new_bits
+                    next_frontier[adjacent_vertex] = (next_frontier.get(adjacent_vertex, 0)
+                                                      | new_bits)
+
+        if distances is not None:
+            for vertex, bits in next_frontier.items():
+                while bits:
+                    lowest_bit = bits & -bits
+                    distances[lowest_bit.bit_length() - 1][vertex] = level
+                    bits ^= lowest_bit
+        frontier = next_frontier
+
+    return reached
+
+
+def reachability(graph, sources):
+    """Return a mask per vertex, with bit idx set if the vertex can be reached from sources[idx].
+
+    All of the sources are searched together in one bit-parallel BFS (see _bit_parallel_bfs), as
+    Python ints have no fixed width.
+    """
+    return _bit_parallel_bfs(graph, list(sources))
+
+
+# The graph searched by the worker processes of all_sources_distances, sent once per worker.
+_worker_graph = None
+
+
+def _set_worker_graph(graph):
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _batch_distances(sources, graph=None):
+    """Return the distances arrays of a batch of sources, from one bit-parallel BFS."""
+    graph = _worker_graph if graph is None else graph
+    distances = [array("l", [-1]) * graph.num_vertices for _ in sources]
+    _bit_parallel_bfs(graph, sources, distances)
+    return distances
+
+
+def all_sources_distances(graph, sources, batch_size=64, workers=1):
+    """Return a list of the distances arrays from each of sources, as BreadthFirstPaths would give.
+
+    Sources are searched batch_size at a time by bit-parallel BFS. With workers > 1 (or None for
+    one per CPU) the batches are spread over a pool of processes, each of which is sent the graph
+    once. A CSRGraph opened with CSRGraph.load is sent as its path, so the workers map the same
+    file and share one copy of the graph through the page cache.
+    """
+    sources = list(sources)
+    batches = [sources[idx : idx + batch_size] for idx in range(0, len(sources), batch_size)]
+    workers = min(workers or os.cpu_count(), len(batches))
+    if workers <= 1:
+        return [distances for batch in batches for distances in _batch_distances(batch, graph)]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_set_worker_graph,
+                             initargs=(graph,)) as executor:
+        return [distances for batch_distances in executor.map(_batch_distances, batches)
+                for distances in batch_distances]
+
+
+if __name__ == "__main__":
+    graph = Graph(8, ((0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (5, 6)))
+    paths = BreadthFirstPaths(graph, 0)
+    print(list(paths.distances))
+    print(list(paths.parents))
+    print(paths.path_to(4), paths.path_to(6))
+
+    # A low diameter random graph, where most levels run bottom up.
+    num_vertices = 10**5
+    edges = [(random.randrange(num_vertices), random.randrange(num_vertices))
+             for _ in range(10 * num_vertices)]
+    graph = CSRGraph.from_edges(num_vertices, edges, directed=False)
+    paths = BreadthFirstPaths(graph, 0)
+    print(max(paths.distances))
+
+    # Hops to the nearest of several sources, and from each of them.
+    paths = BreadthFirstPaths(graph, range(100))
+    print(max(paths.distances))
+    distances = all_sources_distances(graph, range(100), workers=2)
+    print(all(min(column) == distance for *column, distance in zip(*distances, paths.distances)))
@@ -0,0 +1,103 @@
+# Content-defined chunking of byte streams with a Gear rolling hash, for deduplication.
+import hashlib
+import mmap
+import random
+
+# A random looking but fixed number per byte value, so the same content is always cut at the same
+# places, whichever process or run chunks it. Unlike the random radix in strings.py, it must never
+# change between runs.
+_GEAR = [int.from_bytes(hashlib.sha256(bytes([byte])).digest()[:8], "little")
+         for byte in range(256)]
+_HASH_MASK = (1 << 64) - 1
+
+
+def _blocks(data, buffer_size):
+    """Yield data as memoryviews of at most buffer_size bytes, reading it if it is a file object."""
+    if hasattr(data, "readinto"):
+        while True:
+            block = bytearray(buffer_size)
+            read = data.readinto(block)
+            if not read:
+                return
+            yield memoryview(block)[:read]
+    else:
+        view = memoryview(data).cast("B")
+        for start in range(0, len(view), buffer_size):
+            yield view[start : start + buffer_size]
+
+
+# O(n) time. O(buffer_size) space.
+def content_defined_chunks(data, avg_size=8192, min_size=None, max_size=None, digest="sha256",
+                           buffer_size=1 << 20):
+    """Split data into chunks at content-defined boundaries and yield (offset, length, digest).
+
+    data is a binary file object (read buffer_size bytes at a time) or anything that supports the
+    buffer protocol, such as bytes or an mmap. A Gear hash rolls over the bytes, shifting left once
+    and adding a random number per byte so that it depends on the last 64 bytes. A chunk ends where
+    its top log2(avg_size) bits are all zero, so an insertion only moves the boundaries near it and
+    the chunks after it still match earlier copies. Chunks are at least min_size (avg_size // 4)
+    bytes, which isn't hashed, and at most max_size (avg_size * 8). digest names a hashlib hash.
+    """
+    min_size = avg_size // 4 if min_size is None else min_size
+    max_size = avg_size * 8 if max_size is None else max_size
+    if not 0 < min_size <= avg_size <= max_size:
+        raise ValueError("Expected 0 < min_size <= avg_size <= max_size")
+    bits = avg_size.bit_length() - 1
+    boundary_mask = ((1 << bits) - 1) << (64 - bits)
+    gear = _GEAR
+
+    offset, length, value, hasher = 0, 0, 0, hashlib.new(digest)
+    for block in _blocks(data, buffer_size):
+        pos = 0
+        while pos < len(block):
+            if length < min_size:
+                # Boundaries aren't allowed this early in a chunk, so skip the rolling hash.
+                cut = min(len(block), pos + min_size - length)
+                found = False
+            else:
+                cut = min(len(block), pos + max_size - length)
+                found = False
+                for idx in range(pos, cut):
+                    value = ((value << 1) + gear[block[idx]]) & _HASH_MASK
+                    if not value & boundary_mask:
+                        cut, found = idx + 1, True
+                        break
+
+            hasher.update(block[pos:cut])
+            length += cut - pos
+            pos = cut
+            if found or length == max_size:
+                yield offset, length, hasher.digest()
+                offset, length, value, hasher = offset + length, 0, 0, hashlib.new(digest)
+
+    if length:
+        yield offset, length, hasher.digest()
+
+
+def chunk_file(path, **kwargs):
+    """Yield (offset, length, digest) for the content-defined chunks of the file at path.
+
+    The file is memory mapped rather than read, so the operating system pages it in as the chunker
+    reaches it. Takes the same keyword arguments as content_defined_chunks.
+    """
+    with open(path, "rb") as chunked_file:
+        # Empty files can't be mapped.
+        if not chunked_file.seek(0, 2):
+            return
+        with mmap.mmap(chunked_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from content_defined_chunks(mapped, **kwargs)
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    data = bytes(rng.getrandbits(8) for _ in range(200_000))
+    # The same data with a few bytes inserted near the start.
+    edited = data[:1000] + b"inserted" + data[1000:]
+
+    chunks = list(content_defined_chunks(data, avg_size=4096))
+    edited_chunks = list(content_defined_chunks(edited, avg_size=4096))
+    print(len(chunks), [length for _, length, _ in chunks[:5]])
+
+    seen = {digest for _, _, digest in chunks}
+    new_bytes = sum(length for _, length, digest in edited_chunks if digest not in seen)
+    print(f"{new_bytes} of {len(edited)} bytes of the edited data are new")
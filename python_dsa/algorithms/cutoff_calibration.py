@@ -0,0 +1,79 @@
+# Measure the best insertion sort cutoff for each sort and element type on this machine.
+import functools
+import json
+import os
+import random
+import string
+import time
+
+from python_dsa.algorithms import sorting
+from python_dsa.algorithms.sorting import merge_sort, quick_sort, three_way_quick_sort
+
+# Always calibrate the pure Python implementations, even if numpy is installed.
+CALIBRATED_SORTS = {
+    "merge_sort": functools.partial(merge_sort, backend="python"),
+    "quick_sort": functools.partial(quick_sort, backend="python"),
+    "three_way_quick_sort": three_way_quick_sort,
+}
+
+
+def _random_str(rng):
+    return "".join(rng.choices(string.ascii_letters, k=12))
+
+
+# Sorts given a key sort (key, index) tuples, so those are calibrated too.
+ELEMENT_TYPES = {
+    "int": lambda rng: rng.randint(0, 10**9),
+    "float": lambda rng: rng.random(),
+    "str": _random_str,
+    "tuple": lambda rng: (rng.randint(0, 10**9), rng.randint(0, 10**9)),
+}
+
+
+def _best_cutoff(sort, seq, candidates, repeats):
+    """Return the candidate cutoff with the lowest minimum time to sort seq."""
+    best_time, best_cutoff = float("inf"), 0
+    for cutoff in candidates:
+        times = []
+        for _ in range(repeats):
+            copy = seq.copy()
+            start = time.perf_counter()
+            sort(copy, cutoff=cutoff)
+            times.append(time.perf_counter() - start)
+
+        if min(times) < best_time:
+            best_time, best_cutoff = min(times), cutoff
+
+    return best_cutoff
+
+
+def calibrate_cutoffs(sorts=tuple(CALIBRATED_SORTS), element_types=tuple(ELEMENT_TYPES),
+                      candidates=range(0, 65, 4), size=20_000, repeats=3, seed=0,
+                      path=sorting.CUTOFF_CACHE_PATH):
+    """Time each sort on random input of each element type for every candidate cutoff.
+
+    The fastest cutoffs are written to path and returned as {sort name: {element type name:
+    cutoff}}. Sorts called without an explicit cutoff only read sorting.CUTOFF_CACHE_PATH (set by
+    the PYTHON_DSA_CUTOFF_CACHE environment variable), so they only pick up the cutoffs if path is
+    left at its default.
+    """
+    rng = random.Random(seed)
+    cutoffs = {}
+    for name in sorts:
+        cutoffs[name] = {}
+        for type_name in element_types:
+            seq = [ELEMENT_TYPES[type_name](rng) for _ in range(size)]
+            cutoffs[name][type_name] = _best_cutoff(CALIBRATED_SORTS[name], seq, candidates,
+                                                    repeats)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as cache_file:
+        json.dump(cutoffs, cache_file, indent=2)
+
+    # Make sorts in this process use the new cutoffs straight away.
+    sorting._cached_cutoffs.cache_clear()
+    return cutoffs
+
+
+if __name__ == "__main__":
+    print(calibrate_cutoffs())
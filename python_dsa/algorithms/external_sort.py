@@ -0,0 +1,99 @@
+# External merge sort for inputs that do not fit in memory.
+import heapq
+import itertools
+import os
+import pickle
+import random
+import tempfile
+
+from python_dsa.algorithms.sorting import merge_sort
+
+# Number of items pickled together when spilling a run. Larger blocks pickle faster but each open
+# run holds one block in memory while merging.
+_BLOCK_SIZE = 1024
+
+
+def _write_run(items, path):
+    """Spill items to a new file at path, closing it once written."""
+    with open(path, "wb") as run:
+        items = iter(items)
+        while True:
+            block = list(itertools.islice(items, _BLOCK_SIZE))
+            if not block:
+                break
+            pickle.dump(block, run, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path):
+    """Yield items back from a spilled run one block at a time, removing it when exhausted."""
+    with open(path, "rb") as run:
+        while True:
+            try:
+                block = pickle.load(run)
+            except EOFError:
+                break
+            yield from block
+    os.remove(path)
+
+
+# O(nlogn) time. O(chunk_size) memory for sorting runs plus one block per open run when merging.
+def external_sort(iterable, chunk_size=100_000, key=None, reverse=False, sort=merge_sort,
+                  max_open_runs=64, tmp_dir=None):
+    """Yield the items of iterable in sorted order without holding all of them in memory.
+
+    Items are read chunk_size at a time, each chunk is sorted with sort and spilled to a file in a
+    temporary directory, and the sorted runs are k-way merged back together with a heap. Runs are
+    closed once written and only opened while being merged, so if there are more than
+    max_open_runs runs they are merged max_open_runs at a time, level by level, to bound the
+    number of open files. Stable if sort is stable (every sort in sorting.py is stable when given
+    a key).
+    """
+    items = iter(iterable)
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir:
+        run_paths = (os.path.join(run_dir, f"run{idx}") for idx in itertools.count())
+        runs = []
+        while True:
+            chunk = list(itertools.islice(items, chunk_size))
+            if not chunk:
+                break
+            # Not every sort works in place (heapq_sort returns a new list).
+            chunk = sort(chunk, key=key, reverse=reverse)
+
+            # Everything fitted in a single chunk so there is nothing to merge.
+            if not runs and len(chunk) < chunk_size:
+                yield from chunk
+                return
+
+            runs.append(_write_run(chunk, next(run_paths)))
+            del chunk
+
+        # Each level merges consecutive groups of runs, so every item is written once per level
+        # and earlier items stay ahead of equal later items.
+        while len(runs) > max_open_runs:
+            runs = [_write_run(heapq.merge(*map(_read_run, runs[idx : idx + max_open_runs]),
+                                           key=key, reverse=reverse), next(run_paths))
+                    for idx in range(0, len(runs), max_open_runs)]
+
+        yield from heapq.merge(*map(_read_run, runs), key=key, reverse=reverse)
+
+
+def external_sort_file(input_path, output_path, chunk_size=100_000, key=None, reverse=False,
+                       encoding="utf-8", **kwargs):
+    """Sort the lines of the text file at input_path into output_path using external_sort."""
+    with open(input_path, encoding=encoding) as input_file, \
+            open(output_path, "w", encoding=encoding) as output_file:
+        # The last line of a file may not end in a newline. Add one so it is not joined with
+        # whichever line follows it in sorted order.
+        lines = (line if line.endswith("\n") else line + "\n" for line in input_file)
+        output_file.writelines(external_sort(lines, chunk_size=chunk_size, key=key,
+                                             reverse=reverse, **kwargs))
+
+
+if __name__ == "__main__":
+    seq = [random.randint(0, 10**6) for _ in range(10**5)]
+    print(list(external_sort(seq, chunk_size=10**4)) == sorted(seq))
+    print(list(external_sort(seq, chunk_size=10**3, max_open_runs=8)) == sorted(seq))
+    print(list(external_sort(seq, chunk_size=10**4, reverse=True)) == sorted(seq, reverse=True))
+    print(list(external_sort(seq, chunk_size=10**4, key=lambda elem: -elem))
+          == sorted(seq, key=lambda elem: -elem))
@@ -0,0 +1,156 @@
+# Static sorted sets stored in cache friendly layouts (Eytzinger and implicit B-tree).
+import bisect
+import itertools
+import random
+from array import array
+
+from python_dsa.algorithms.sorting import _numeric_typecode
+
+
+def _storage(values, typecode):
+    """Store values in a compact array.array if they are numeric, otherwise in a list."""
+    typecode = typecode or _numeric_typecode(values)
+    return array(typecode, values) if typecode else list(values)
+
+
+class _StaticIndex:
+    """Shared behaviour of the static indexes.
+
+    Subclasses store their keys in self._keys and the sorted order index of the key in each slot in
+    self._ranks, and implement _descend (returning a slot) and _in_order_slots.
+    """
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return (self._keys[slot] for slot in self._in_order_slots())
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    def contains(self, key):
+        slot = self._descend(key, strict=False)
+        return slot is not None and self._keys[slot] == key
+
+    def lower_bound(self, key):
+        """Return the index in sorted order of the first key not less than key (bisect_left)."""
+        slot = self._descend(key, strict=False)
+        return self._size if slot is None else self._ranks[slot]
+
+    def upper_bound(self, key):
+        """Return the index in sorted order of the first key greater than key (bisect_right)."""
+        slot = self._descend(key, strict=True)
+        return self._size if slot is None else self._ranks[slot]
+
+
+class EytzingerIndex(_StaticIndex):
+    """Keys stored in breadth first order of an implicit binary search tree.
+
+    The children of slot k are at 2k and 2k + 1, so the next few levels of a search sit next to each
+    other in memory rather than being spread across the whole sorted array.
+    """
+
+    def __init__(self, keys, typecode=None):
+        sorted_keys = sorted(set(keys))
+        self._size = len(sorted_keys)
+        # Slot 0 is unused so the root is at 1. Any key will do as a placeholder there, as long as
+        # the array can hold it.
+        slots = sorted_keys[:1] * (self._size + 1)
+        ranks = [self._size] * (self._size + 1)
+
+        # Fill the tree in order (left subtree, node, right subtree) with the sorted keys.
+        for rank, slot in enumerate(self._in_order_slots()):
+            slots[slot], ranks[slot] = sorted_keys[rank], rank
+
+        self._keys = _storage(slots, typecode)
+        self._ranks = array("l", ranks)
+
+    def _in_order_slots(self):
+        """Yield the slots of the tree in sorted key order."""
+        stack, slot = [], 1
+        while stack or slot <= self._size:
+            if slot <= self._size:
+                stack.append(slot)
+                slot *= 2
+            else:
+                slot = stack.pop()
+                yield slot
+                slot = 2 * slot + 1
+
+    def _descend(self, key, strict):
+        """Return the slot of the first key greater than (strict) or at least key, or None."""
+        keys, slot = self._keys, 1
+        if strict:
+            while slot <= self._size:
+                slot = 2 * slot + (keys[slot] <= key)
+        else:
+            while slot <= self._size:
+                slot = 2 * slot + (keys[slot] < key)
+
+        # Each right turn appended a 1 bit to slot. Strip the trailing right turns and the final
+        # left turn to get back to the last node the search went left at, which is the answer.
+        slot >>= (slot ^ (slot + 1)).bit_length()
+        return slot or None
+
+
+class BTreeIndex(_StaticIndex):
+    """Keys stored in blocks of block_size, laid out as an implicit static B-tree.
+
+    Block k holds block_size keys and its children are blocks k * (block_size + 1) + 1 onwards, so a
+    search reads one contiguous block per level and needs only log_(block_size + 1)(n) levels.
+    """
+
+    def __init__(self, keys, block_size=16, typecode=None):
+        sorted_keys = sorted(set(keys))
+        self._size = len(sorted_keys)
+        self.block_size = block_size
+        self._num_blocks = -(-self._size // block_size)
+
+        # Slots past the last key are padded with the largest key so every block stays sorted. They
+        # come last in order, so a search only ends on one if every real key is too small.
+        slots = sorted_keys[-1:] * (self._num_blocks * block_size)
+        ranks = [self._size] * (self._num_blocks * block_size)
+        for rank, slot in zip(range(self._size), self._in_order_slots(padding=True)):
+            slots[slot], ranks[slot] = sorted_keys[rank], rank
+
+        self._keys = _storage(slots, typecode)
+        self._ranks = array("l", ranks)
+
+    def _in_order_slots(self, padding=False):
+        """Yield the slots of the tree in sorted key order, including padding slots if asked."""
+        def visit(block):
+            if block >= self._num_blocks:
+                return
+            for idx in range(self.block_size):
+                yield from visit(block * (self.block_size + 1) + idx + 1)
+                yield block * self.block_size + idx
+            yield from visit(block * (self.block_size + 1) + self.block_size + 1)
+
+        slots = visit(0)
+        return slots if padding else itertools.islice(slots, self._size)
+
+    def _descend(self, key, strict):
+        """Return the slot of the first key greater than (strict) or at least key, or None."""
+        keys, block_size = self._keys, self.block_size
+        search = bisect.bisect_right if strict else bisect.bisect_left
+        found, block = None, 0
+        while block < self._num_blocks:
+            start = block * block_size
+            idx = search(keys, key, start, start + block_size) - start
+            if idx < block_size and self._ranks[start + idx] < self._size:
+                found = start + idx
+            block = block * (block_size + 1) + idx + 1
+        return found
+
+
+if __name__ == "__main__":
+    keys = [1, 4, 6, 10, 15, 53]
+    for index in (EytzingerIndex(keys), BTreeIndex(keys, block_size=2)):
+        print(list(index._keys))
+        print(4 in index, 5 in index)
+        print(index.lower_bound(5), index.upper_bound(6), index.lower_bound(100))
+
+    keys = random.sample(range(10**6), 10**4)
+    index = BTreeIndex(keys)
+    print(all(key in index for key in keys))
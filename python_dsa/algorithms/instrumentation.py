@@ -0,0 +1,172 @@
+# Opt-in operation counting for the sorts in sorting.py.
+import functools
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+from python_dsa.algorithms.sorting import (_decorate, _undecorate, _write_back, merge_sort,
+                                           quick_sort, quickselect)
+
+
+@dataclass
+class SortStats:
+    compares: int = 0
+    # Elements written into the sequence being sorted or into copies of it, such as aux arrays. A
+    # swap is two moves.
+    moves: int = 0
+    # Peak memory allocated by the sort on top of its input, such as aux arrays and slices.
+    aux_bytes: int = 0
+    # Largest number of simultaneously active calls of any one function, i.e. recursion depth.
+    max_depth: int = 0
+
+
+class _CountedItem:
+    """Wraps an element and counts every ordering comparison made between wrapped elements.
+
+    Equality tests aren't counted, as tuple comparison makes one before every ordering comparison
+    of its items.
+    """
+
+    __slots__ = ("value", "stats")
+
+    def __init__(self, value, stats):
+        self.value = value
+        self.stats = stats
+
+    def __lt__(self, other):
+        self.stats.compares += 1
+        return self.value < other.value
+
+    def __gt__(self, other):
+        self.stats.compares += 1
+        return self.value > other.value
+
+    def __le__(self, other):
+        self.stats.compares += 1
+        return self.value <= other.value
+
+    def __ge__(self, other):
+        self.stats.compares += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __ne__(self, other):
+        return self.value != other.value
+
+
+class _CountedList(list):
+    """A list that counts the elements written into it and into slices and copies of it."""
+
+    def __init__(self, values, stats):
+        super().__init__(values)
+        self.stats = stats
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return _CountedList(super().__getitem__(idx), self.stats)
+        return super().__getitem__(idx)
+
+    def copy(self):
+        return _CountedList(self, self.stats)
+
+    def __setitem__(self, idx, value):
+        if isinstance(idx, slice):
+            value = list(value)
+            self.stats.moves += len(value)
+        else:
+            self.stats.moves += 1
+        super().__setitem__(idx, value)
+
+
+def _unwrap(result):
+    """Strip _CountedItem wrappers from whatever a sort or selection function returned."""
+    if isinstance(result, _CountedItem):
+        return result.value
+    if isinstance(result, list):
+        return [item.value for item in result]
+    return result
+
+
+def instrumented(sort, callback=None):
+    """Return a drop-in version of sort that records a SortStats for every call.
+
+    Elements are wrapped to count comparisons and the sequence is wrapped to count moves, while a
+    profile hook tracks recursion depth and tracemalloc measures auxiliary memory. Given a key or
+    reverse, the sorts in sorting.py sort (key, index) pairs rather than the elements, so the pairs
+    are counted instead. The stats of the latest call are kept on the returned function's stats
+    attribute and passed to callback if given. sort itself is not changed, so it costs nothing
+    extra when it is called directly.
+    """
+    @functools.wraps(sort)
+    def wrapper(seq, *args, key=None, **kwargs):
+        stats = SortStats()
+        unkeyed = getattr(sort, "unkeyed", None)
+        reverse = kwargs.pop("reverse", False) if unkeyed is not None else False
+        keyed = unkeyed is not None and (key is not None or reverse)
+        if keyed:
+            # Run the sort on the pairs its key and reverse arguments would make, so the moves and
+            # compares it makes on them are counted, with each compare of two pairs counted once.
+            counted = _CountedList((_CountedItem(pair, stats)
+                                    for pair in _decorate(seq, key, reverse)), stats)
+        else:
+            counted = _CountedList((_CountedItem(elem, stats) for elem in seq), stats)
+            if key is not None:
+                # Count comparisons between keys rather than between the (unwrapped) elements.
+                kwargs["key"] = lambda item: _CountedItem(key(item.value), stats)
+
+        depths = {}
+
+        def profile(frame, event, arg):
+            if event == "call":
+                depth = depths.get(frame.f_code, 0) + 1
+                depths[frame.f_code] = depth
+                stats.max_depth = max(stats.max_depth, depth)
+            elif event == "return":
+                depths[frame.f_code] -= 1
+
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        previous_profile = sys.getprofile()
+        sys.setprofile(profile)
+        try:
+            result = (unkeyed if keyed else sort)(counted, *args, **kwargs)
+        finally:
+            sys.setprofile(previous_profile)
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            if not was_tracing:
+                tracemalloc.stop()
+        stats.aux_bytes = peak_bytes - start_bytes
+
+        if keyed:
+            result = _undecorate(seq, _unwrap(result), reverse)
+        # Sorts work in place, so copy the sorted elements back into the caller's sequence.
+        elif result is counted:
+            _write_back(seq, _unwrap(counted))
+            result = seq
+        else:
+            result = _unwrap(result)
+
+        wrapper.stats = stats
+        if callback is not None:
+            callback(stats)
+        return result
+
+    wrapper.stats = None
+    return wrapper
+
+
+if __name__ == "__main__":
+    seq = [random.randint(0, 10**6) for _ in range(1000)]
+
+    counted_merge_sort = instrumented(merge_sort)
+    counted_merge_sort(seq.copy(), cutoff=10)
+    print(counted_merge_sort.stats)
+
+    instrumented(quick_sort, callback=print)(seq.copy())
+    print(instrumented(quickselect, callback=print)(seq.copy(), 500))
@@ -0,0 +1,176 @@
+# String and integer sorts based on key-indexed counting (Algorithms, section 5.1).
+import itertools
+import random
+from collections import defaultdict
+
+from python_dsa.algorithms.sorting import _insertion_sort_range, _write_back, insertion_sort
+
+
+def _char_at(elem, depth):
+    """Return the character code of elem at depth, or -1 past the end so shorter keys sort first."""
+    if depth >= len(elem):
+        return -1
+    char = elem[depth]
+    # Indexing bytes already gives an int.
+    return char if isinstance(char, int) else ord(char)
+
+
+# O(n + radix) time. O(n + radix) space. Stable.
+def key_indexed_counting(seq, radix, key=None):
+    """Sort seq by key(elem), a small int in range(radix), by counting how often each key occurs."""
+    key = key or (lambda elem: elem)
+    keys = [key(elem) for elem in seq]
+
+    # Count the frequency of each key, offset by one so the cumulates give start indices.
+    count = [0] * (radix + 1)
+    for elem_key in keys:
+        count[elem_key + 1] += 1
+    for idx in range(radix):
+        count[idx + 1] += count[idx]
+
+    # Distribute each element to its key's next free index.
+    aux = [None] * len(seq)
+    for elem, elem_key in zip(seq, keys):
+        aux[count[elem_key]] = elem
+        count[elem_key] += 1
+
+    _write_back(seq, aux)
+    return seq
+
+
+# O(wn) time for n keys of width w. O(n + radix) space. Stable.
+def lsd_sort(seq, width=None, radix=256):
+    """Sort fixed width strings or bytes one character at a time, from the right."""
+    if not seq:
+        return seq
+    width = len(seq[0]) if width is None else width
+
+    # Appending to a list per character value is key-indexed counting without the separate counting
+    # pass, which is faster in Python than filling an index-addressed aux array.
+    items = list(seq)
+    is_bytes = isinstance(items[0], (bytes, bytearray))
+    if is_bytes:
+        largest = max(max(elem[:width], default=0) for elem in items)
+    else:
+        largest = max(ord(max(elem[:width], default="\0")) for elem in items)
+    if largest >= radix:
+        raise ValueError(f"Character code {largest} doesn't fit in radix {radix}")
+
+    for depth in range(width - 1, -1, -1):
+        buckets = [[] for _ in range(radix)]
+        # Every key has a character at depth, so look it up inline rather than through _char_at.
+        if is_bytes:
+            for elem in items:
+                buckets[elem[depth]].append(elem)
+        else:
+            for elem in items:
+                buckets[ord(elem[depth])].append(elem)
+        items = list(itertools.chain.from_iterable(buckets))
+
+    _write_back(seq, items)
+    return seq
+
+
+# O(n * bits / digit_bits) time. O(n + 2**digit_bits) space. Stable.
+def lsd_int_sort(seq, digit_bits=8):
+    """Sort ints of any size or sign digit_bits at a time, from the right."""
+    if not seq:
+        return seq
+
+    # Sorting offsets from the minimum handles negative numbers, and only as many passes as the
+    # range of values needs are made, so small IDs in a 64-bit field don't pay for all 8 bytes.
+    minimum = min(seq)
+    passes = -(-(max(seq) - minimum).bit_length() // digit_bits)
+    mask = (1 << digit_bits) - 1
+
+    items = list(seq)
+    for shift in range(0, passes * digit_bits, digit_bits):
+        buckets = [[] for _ in range(mask + 1)]
+        for elem in items:
+            buckets[((elem - minimum) >> shift) & mask].append(elem)
+        items = list(itertools.chain.from_iterable(buckets))
+
+    _write_back(seq, items)
+    return seq
+
+
+# O(n * average length examined) time. O(n + radix * w) space for the buckets along the recursion.
+# Stable.
+def msd_sort(seq, cutoff=15):
+    """Sort variable length strings or bytes one character at a time, from the left."""
+    def sort(items, depth):
+        """Split items on the character at depth and sort each bucket on the next character."""
+        # All items share their first depth characters, so comparing them whole only looks at the
+        # rest.
+        if len(items) <= cutoff:
+            return insertion_sort(items)
+
+        # Keys are sparse and may come from any alphabet, so only the buckets that are used are
+        # created. Keys that have ended (-1) come first.
+        buckets = defaultdict(list)
+        for elem in items:
+            buckets[_char_at(elem, depth)].append(elem)
+
+        result = buckets.pop(-1, [])
+        for char in sorted(buckets):
+            result.extend(sort(buckets[char], depth + 1))
+        return result
+
+    _write_back(seq, sort(list(seq), depth=0))
+    return seq
+
+
+# O(nlogn) character comparisons on average. O(logn + w) space for recursion. Not stable.
+def three_way_string_quick_sort(seq, cutoff=15):
+    """Three-way partition strings or bytes on the character at each depth (Quick3string)."""
+    # Shuffle seq to avoid worst case time complexity.
+    random.shuffle(seq)
+
+    def sort(lo, hi, depth):
+        """Three-way partition seq[lo..hi] on the character at depth."""
+        if hi - lo <= cutoff:
+            _insertion_sort_range(seq, lo, hi)
+            return
+
+        partition_char = _char_at(seq[lo], depth)
+        partition_idx, idx, from_right = lo, lo + 1, hi
+        while idx <= from_right:
+            char = _char_at(seq[idx], depth)
+            if char < partition_char:
+                seq[partition_idx], seq[idx] = seq[idx], seq[partition_idx]
+                partition_idx += 1
+                idx += 1
+            elif char > partition_char:
+                seq[from_right], seq[idx] = seq[idx], seq[from_right]
+                from_right -= 1
+            else:
+                idx += 1
+
+        sort(lo, partition_idx - 1, depth)
+        # Keys in the middle share the partitioning character, so move on to the next one unless
+        # they have all ended.
+        if partition_char >= 0:
+            sort(partition_idx, from_right, depth + 1)
+        sort(from_right + 1, hi, depth)
+
+    sort(0, len(seq) - 1, depth=0)
+    return seq
+
+
+if __name__ == "__main__":
+    print(key_indexed_counting([3, 1, 2, 0, 3, 1], radix=4))
+    print(key_indexed_counting(["c", "a", "b", "a"], radix=3, key=lambda elem: ord(elem) - ord("a")))
+
+    plates = ["4PGC938", "2IYE230", "3CIO720", "1ICK750", "1OHV845", "4JZY524", "1ICK750", "3CIO720",
+              "1OHV845", "1OHV845", "2RLA629", "2RLA629", "3ATW723"]
+    print(lsd_sort(plates.copy()))
+
+    words = ["she", "sells", "seashells", "by", "the", "sea", "shore", "the", "shells", "she",
+             "sells", "are", "surely", "seashells"]
+    print(msd_sort(words.copy(), cutoff=0))
+    print(three_way_string_quick_sort(words.copy(), cutoff=0))
+
+    ids = [random.randint(-2**63, 2**63 - 1) for _ in range(10)]
+    print(lsd_int_sort(ids.copy()) == sorted(ids))
+    hex_ids = [f"{random.getrandbits(64):016x}" for _ in range(10)]
+    print(lsd_sort(hex_ids.copy()) == sorted(hex_ids))
@@ -1,27 +1,145 @@
+import functools
 import heapq
-import math
+import json
+import os
 import random
-from timeit import repeat
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 random.seed(77)
 
+# Where calibrate_cutoffs stores the measured insertion sort cutoffs for this machine.
+CUTOFF_CACHE_PATH = os.environ.get(
+    "PYTHON_DSA_CUTOFF_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "python_dsa", "cutoffs.json"))
+
+
+def _write_back(seq, values):
+    """Replace the contents of seq with values, preserving the type of seq."""
+    seq[:] = array(seq.typecode, values) if isinstance(seq, array) else values
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_cutoffs():
+    """Load the calibrated cutoffs once per process, or nothing if they haven't been calibrated."""
+    try:
+        with open(CUTOFF_CACHE_PATH) as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _cutoff(sort_name, seq, cutoff):
+    """Return cutoff if given, else the calibrated cutoff for sort_name and seq's element type."""
+    if cutoff is not None:
+        return cutoff
+    if not seq:
+        return 0
+    return _cached_cutoffs().get(sort_name, {}).get(type(seq[0]).__name__, 0)
+
+
+def _numeric_typecode(seq):
+    """Return the array typecode that can hold every element of seq, or None if there isn't one."""
+    if isinstance(seq, array):
+        # Unicode character arrays are not numeric.
+        return None if seq.typecode in "uw" else seq.typecode
+    if all(type(elem) is float for elem in seq):
+        return "d"
+    if all(type(elem) is int for elem in seq) and -2**63 <= min(seq) and max(seq) < 2**63:
+        return "q"
+    return None
+
+
+def _vectorized(kind):
+    """Sort homogeneous numeric input with numpy's sort of the given kind if numpy is installed.
+
+    The wrapped sort gains a backend argument: "auto" uses numpy when it can and "python" always
+    runs the pure Python implementation.
+    """
+    def decorator(sort):
+        @functools.wraps(sort)
+        def wrapper(seq, *args, backend="auto", **kwargs):
+            if backend == "python" or np is None or not seq:
+                return sort(seq, *args, **kwargs)
+
+            typecode = _numeric_typecode(seq)
+            if typecode is None:
+                return sort(seq, *args, **kwargs)
+
+            if isinstance(seq, array):
+                # Sort the array's own buffer in place without copying it.
+                np.asarray(memoryview(seq)).sort(kind=kind)
+            else:
+                values = np.array(seq, dtype=typecode)
+                values.sort(kind=kind)
+                seq[:] = values.tolist()
+            return seq
+
+        return wrapper
+
+    return decorator
+
+
+def _decorate(seq, key, reverse):
+    """Return the (key, index) pairs that _keyed sorts in place of the elements of seq."""
+    keys = seq if key is None else map(key, seq)
+    # Negate indices when reversing so equal keys keep their original order once the sorted
+    # pairs are reversed.
+    sign = -1 if reverse else 1
+    return [(elem_key, sign * idx) for idx, elem_key in enumerate(keys)]
+
+
+def _undecorate(seq, decorated, reverse):
+    """Rearrange seq into the order of its sorted pairs from _decorate and return it."""
+    if reverse:
+        decorated.reverse()
+    sign = -1 if reverse else 1
+    _write_back(seq, [seq[sign * idx] for _, idx in decorated])
+    return seq
+
+
+def _keyed(sort):
+    """Add key and reverse arguments to sort.
+
+    The key of each element is computed exactly once and paired with the element's original index.
+    The wrapped sort only compares these (key, index) pairs, so the element itself is never compared
+    and ties are broken by position, which makes every sort stable when key or reverse is given.
+    """
+    @functools.wraps(sort)
+    def wrapper(seq, *args, key=None, reverse=False, **kwargs):
+        if key is None and not reverse:
+            return sort(seq, *args, **kwargs)
+
+        decorated = sort(_decorate(seq, key, reverse), *args, **kwargs)
+        return _undecorate(seq, decorated, reverse)
+
+    # The sort without key and reverse, for instrumentation to run on the pairs itself.
+    wrapper.unkeyed = sort
+    return wrapper
+
 
 # O(n**2). O(1) space. Not stable.
+@_keyed
 def selection_sort(seq):
     """For each index in seq, swap with minimum value from the remaining values."""
-    for idx, elem in enumerate(seq):
-        minimum = math.inf
-        for other_idx, other_elem in enumerate(seq[idx:], start=idx):
-            if minimum > other_elem:
-                minimum = other_elem
+    for idx in range(len(seq)):
+        min_idx = idx
+        for other_idx in range(idx + 1, len(seq)):
+            if seq[other_idx] < seq[min_idx]:
                 min_idx = other_idx
-        if minimum != math.inf:
-            # Swap elements.
-            seq[idx], seq[min_idx] = minimum, elem
+        # Swap elements.
+        seq[idx], seq[min_idx] = seq[min_idx], seq[idx]
     return seq
 
 
 # O(n**2). O(1) space. Stable sort.
+@_keyed
 def insertion_sort(seq):
     """For each element, compare and swap with elements to the left."""
     for idx, elem in enumerate(seq):
@@ -41,6 +159,7 @@ def insertion_sort(seq):
 
 
 # O(n**3/2) or thereabouts. Not necessarily quadratic. Not stable.
+@_keyed
 def shell_sort(seq):
     """Initalize h as a steadily large value, h-sort, and steadily decrease h to completely sort."""
     h = 1
@@ -60,9 +179,16 @@ def shell_sort(seq):
 
 
 # O(nlogn) guaranteed worst case and O(n) space for auxiliary array.
-def merge_sort(seq, cutoff=0):
-    """Cut off to insertion sort when seq contains less than or equal to specified number of elements."""
-    aux = [None] * len(seq)
+@_keyed
+@_vectorized("stable")
+def merge_sort(seq, cutoff=None):
+    """Cut off to insertion sort when seq contains less than or equal to specified number of elements.
+
+    Uses the calibrated cutoff for seq's element type if cutoff isn't given.
+    """
+    cutoff = _cutoff("merge_sort", seq, cutoff)
+    # A copy rather than a fresh list, so that it has the same type as seq.
+    aux = seq[:]
 
     def sort(seq, lo, hi):
         """Recursively split seq into two subarrays and sort (stable)."""
@@ -70,7 +196,7 @@ def merge_sort(seq, cutoff=0):
             return
 
         if hi - lo <= cutoff:
-            seq[lo : hi + 1] = insertion_sort(seq[lo : hi + 1])
+            _insertion_sort_range(seq, lo, hi)
         else:
             mid = (hi + lo) // 2
             sort(seq, lo=lo, hi=mid)
@@ -101,10 +227,69 @@ def merge_sort(seq, cutoff=0):
     return seq
 
 
+# O(nlogn) guaranteed worst case and O(n) space for a single auxiliary array. No recursion.
+@_keyed
+def bottom_up_merge_sort(seq, cutoff=0):
+    """Merge runs of doubling width, alternating whether seq or aux is the source on each pass."""
+    width = cutoff + 1
+    if width > 1:
+        for lo in range(0, len(seq), width):
+            _insertion_sort_range(seq, lo, min(lo + width, len(seq)) - 1)
+
+    # Rather than copying each subarray into aux before merging it back into seq, merge from src
+    # into dst and then swap their roles for the next pass.
+    src, dst = seq, seq[:]
+    while width < len(seq):
+        for lo in range(0, len(seq), 2 * width):
+            mid, hi = min(lo + width, len(seq)), min(lo + 2 * width, len(seq))
+            if mid < hi:
+                _merge_into(src, dst, lo, mid, hi)
+            else:
+                dst[lo:hi] = src[lo:hi]
+        src, dst = dst, src
+        width *= 2
+
+    if src is not seq:
+        seq[:] = src
+    return seq
+
+
+def _partition(seq, lo, hi):
+    """Partition seq[lo..hi] around seq[lo] and return the index it ends up at (its sorted place)."""
+    from_left, from_right = lo, hi
+    partition_value = seq[lo]
+    while True:
+        # Find leftmost value from partition that is greater than partition.
+        from_left += 1
+        while seq[from_left] < partition_value:
+            if from_left == hi:
+                break
+            from_left += 1
+
+        # Find rightmost value from other side that is less than partition.
+        while seq[from_right] > partition_value:
+            if from_right == lo:
+                break
+            from_right -= 1
+
+        if from_left >= from_right:
+            break
+        # Exchange left and right values.
+        seq[from_left], seq[from_right] = seq[from_right], seq[from_left]
+
+    # Exchange parition with left-most value (which is now from_right).
+    seq[lo], seq[from_right] = seq[from_right], seq[lo]
+
+    return from_right
+
+
 # O(nlogn) average case. Generally faster than mergesort due to less data movement. O(n**2) at worst.
 # Between O(logn) and O(n) space complexity due to recursive sort calls.
-def quick_sort(seq, cutoff=0):
+@_keyed
+@_vectorized("quicksort")
+def quick_sort(seq, cutoff=None):
     """Scan seq from both left and right (converging in center) and sort by exchanging values."""
+    cutoff = _cutoff("quick_sort", seq, cutoff)
     # Shuffle seq to avoid worst case time complexity of O(n**2).
     random.shuffle(seq)
 
@@ -114,48 +299,105 @@ def quick_sort(seq, cutoff=0):
             return
 
         if hi - lo <= cutoff:
-            seq[lo : hi + 1] = insertion_sort(seq[lo : hi + 1])
+            _insertion_sort_range(seq, lo, hi)
         else:
-            idx = partition(seq, lo, hi)
+            idx = _partition(seq, lo, hi)
             sort(seq, lo, idx - 1)
             sort(seq, idx + 1, hi)
 
-    def partition(seq, lo, hi):
-        """Find partition index which is in correct sorted place."""
-        from_left, from_right = lo, hi
-        partition_value = seq[lo]
-        while True:
-            # Find leftmost value from partition that is greater than partition.
-            from_left += 1
-            while seq[from_left] < partition_value:
-                if from_left == hi:
-                    break
-                from_left += 1
-
-            # Find rightmost value from other side that is less than partition.
-            while seq[from_right] > partition_value:
-                if from_right == lo:
-                    break
-                from_right -= 1
-
-            if from_left >= from_right:
-                break
-            # Exchange left and right values.
-            seq[from_left], seq[from_right] = seq[from_right], seq[from_left]
+    sort(seq, 0, len(seq) - 1)
+    return seq
 
-        # Exchange parition with left-most value (which is now from_right).
-        seq[lo], seq[from_right] = seq[from_right], seq[lo]
 
-        return from_right
+# O(n) average case. O(n**2) worst case, made unlikely by shuffling. O(1) space.
+def nth_element(seq, k):
+    """Rearrange seq so seq[k] is the element that would be there if seq were sorted.
 
-    sort(seq, 0, len(seq) - 1)
+    No element before index k is larger than seq[k] and no element after it is smaller.
+    """
+    if not 0 <= k < len(seq):
+        raise IndexError("k is out of range")
+
+    # Shuffle seq to avoid worst case time complexity of O(n**2).
+    random.shuffle(seq)
+
+    # Only the side of each partition that contains index k needs to be partitioned again.
+    lo, hi = 0, len(seq) - 1
+    while lo < hi:
+        idx = _partition(seq, lo, hi)
+        if idx < k:
+            lo = idx + 1
+        elif idx > k:
+            hi = idx - 1
+        else:
+            break
+
+    return seq
+
+
+def quickselect(seq, k):
+    """Return the kth smallest (zero-indexed) element of seq, partially reordering seq."""
+    return nth_element(seq, k)[k]
+
+
+# O(n + klogk). O(k) space.
+def partial_sort(seq, k, sort=merge_sort):
+    """Rearrange seq so its first k elements are its k smallest elements in sorted order."""
+    if k <= 0:
+        return seq
+    if k >= len(seq):
+        return sort(seq)
+
+    nth_element(seq, k - 1)
+    seq[:k] = sort(seq[:k])
     return seq
 
 
+# O(nlogk) time. O(k) space, so the iterable can be a stream of any length.
+def top_k(iterable, k, key=None, largest=True):
+    """Return the k largest (or smallest) items of iterable, best first.
+
+    Only a heap of the best k items seen so far is kept while iterable is consumed.
+    """
+    if largest:
+        return heapq.nlargest(k, iterable, key=key)
+    return heapq.nsmallest(k, iterable, key=key)
+
+
+def _three_way_partition(seq, lo, hi):
+    """Partition seq[lo..hi] around seq[lo] into less than, equal to and greater than regions.
+
+    Returns the inclusive bounds of the equal region.
+    """
+    partition_value = seq[lo]
+    partition_idx, idx, from_right = lo, lo + 1, hi
+    while idx <= from_right:
+        # Swap partition value with current index value if it is less than current index
+        # value. Then move the partition value pointer up one to match the swap.
+        if seq[idx] < partition_value:
+            seq[partition_idx], seq[idx] = seq[idx], seq[partition_idx]
+            partition_idx += 1
+            idx += 1
+        # Otherwise, if the current index value is greater than the partition value, swap
+        # the current index value with the value in the index from_right. This brings any of
+        # the large values on the right hand side of the sequence to the left.
+        elif seq[idx] > partition_value:
+            seq[from_right], seq[idx] = seq[idx], seq[from_right]
+            from_right -= 1
+        # If the paritition value is equal to the current index value, advance to the next
+        # index.
+        else:
+            idx += 1
+
+    return partition_idx, from_right
+
+
 # O(n) best case with equal keys. O(n**2) worst case and O(nlogn) average case (same as quicksort).
 # Uses O(logn) space for recursion.
-def three_way_quick_sort(seq, cutoff=0):
+@_keyed
+def three_way_quick_sort(seq, cutoff=None):
     """Quicksort variation used to quickly sort sequences with duplicate elements"""
+    cutoff = _cutoff("three_way_quick_sort", seq, cutoff)
     # Shuffle seq to avoid worst case time complexity of O(n**2).
     random.shuffle(seq)
 
@@ -165,30 +407,11 @@ def three_way_quick_sort(seq, cutoff=0):
             return
 
         if hi - lo <= cutoff:
-            seq[lo : hi + 1] = insertion_sort(seq[lo : hi + 1])
+            _insertion_sort_range(seq, lo, hi)
         else:
-            partition_value = seq[lo]
-            partition_idx, idx, from_right = lo, lo + 1, hi
-            while idx <= from_right:
-                # Swap partition value with current index value if it is less than current index
-                # value. Then move the partition value pointer up one to match the swap.
-                if seq[idx] < partition_value:
-                    seq[partition_idx], seq[idx] = seq[idx], seq[partition_idx]
-                    partition_idx += 1
-                    idx += 1
-                # Otherwise, if the current index value is greater than the partition value, swap
-                # the current index value with the value in the index from_right. This brings any of
-                # the large values on the right hand side of the sequence to the left.
-                elif seq[idx] > partition_value:
-                    seq[from_right], seq[idx] = seq[idx], seq[from_right]
-                    from_right -= 1
-                # If the paritition value is equal to the current index value, advance to the next
-                # index.
-                else:
-                    idx += 1
-
             # Partition index and from_right are the bounds of one value's indices. Repeat the sort
             # for other values.
+            partition_idx, from_right = _three_way_partition(seq, lo, hi)
             sort(seq, lo, partition_idx - 1)
             sort(seq, from_right + 1, hi)
 
@@ -196,6 +419,7 @@ def three_way_quick_sort(seq, cutoff=0):
     return seq
 
 
+@_keyed
 def heap_sort(seq):
     """Constructs a heap and iterates over each element to sink it to correct positon"""
     def sink(value, length):
@@ -224,80 +448,229 @@ def heap_sort(seq):
 
     return seq
 
+@_keyed
 def heapq_sort(seq):
     """Heap sort implementation using heapq module."""
     heapq.heapify(seq)
     return [heapq.heappop(seq) for _ in range(len(seq))]
 
-def main(seq):
-    """Runs each sort on seq"""
-    # Sort individually ahead of time to check correctness.
-    system_sort = sorted(seq)
-    selection = selection_sort(seq.copy())
-    insertion = insertion_sort(seq.copy())
-    shell = shell_sort(seq.copy())
-    merge = merge_sort(seq.copy())
-    quick = quick_sort(seq.copy())
-    heap = heap_sort(seq.copy())
-    heapq_result = heapq_sort(seq.copy())
-
-    # Improved sorts.
-    cutoff = 10
-    merge_with_cutoff = merge_sort(seq.copy(), cutoff)
-    quick_with_cutoff = quick_sort(seq.copy(), cutoff)
-    three_way_quick = three_way_quick_sort(seq.copy())
-    three_way_quick_with_cutoff = three_way_quick_sort(seq.copy(), cutoff)
-
-    num_times = 10
-    rep = 1
-
-    def min_time(sort_type, **kwargs):
-        stmt = ((f"{sort_type}({seq.copy()}, "
-                f"{', '.join('='.join((str(k), str(v))) for k, v in kwargs.items())})")
-                if kwargs else f"{sort_type}({seq.copy()})")
-
-        if sort_type != "sorted":
-            times = repeat(setup=f'from __main__ import {sort_type}',
-                           stmt=stmt,
-                           repeat=rep, number=num_times)
+def _insertion_sort_range(seq, lo, hi):
+    """Insertion sort seq[lo..hi] in place without slicing it out of seq."""
+    for idx in range(lo + 1, hi + 1):
+        elem = seq[idx]
+        other_idx = idx - 1
+        while other_idx >= lo and elem < seq[other_idx]:
+            seq[other_idx + 1] = seq[other_idx]
+            other_idx -= 1
+        seq[other_idx + 1] = elem
+
+
+def _heap_sort_range(seq, lo, hi):
+    """Heap sort seq[lo..hi] in place, treating seq[lo] as the root of the heap."""
+    length = hi - lo + 1
+
+    def sink(node, length):
+        while 2 * node + 1 < length:
+            child = 2 * node + 1
+            if child + 1 < length and seq[lo + child] < seq[lo + child + 1]:
+                child += 1
+            if not seq[lo + node] < seq[lo + child]:
+                break
+            seq[lo + node], seq[lo + child] = seq[lo + child], seq[lo + node]
+            node = child
+
+    for node in range(length // 2 - 1, -1, -1):
+        sink(node, length)
+
+    for end in range(length - 1, 0, -1):
+        seq[lo], seq[lo + end] = seq[lo + end], seq[lo]
+        sink(0, end)
+
+
+def _median_of_three(seq, lo, hi):
+    """Move the median of seq[lo], seq[mid] and seq[hi] to seq[lo] to be used as the pivot."""
+    mid = (lo + hi) // 2
+    if seq[mid] < seq[lo]:
+        seq[mid], seq[lo] = seq[lo], seq[mid]
+    if seq[hi] < seq[mid]:
+        seq[hi], seq[mid] = seq[mid], seq[hi]
+        if seq[mid] < seq[lo]:
+            seq[mid], seq[lo] = seq[lo], seq[mid]
+    # seq[lo] <= seq[mid] <= seq[hi]. Swap the median into the pivot position.
+    seq[lo], seq[mid] = seq[mid], seq[lo]
+
+
+def _natural_runs(seq, max_runs):
+    """Return the start index of each ascending run in seq, or None if there are more than max_runs.
+
+    Strictly descending runs are reversed in place so that every run is ascending. Requiring strict
+    descent keeps equal elements in their original order.
+    """
+    runs = []
+    idx = 0
+    while idx < len(seq):
+        if len(runs) == max_runs:
+            return None
+        runs.append(idx)
+
+        end = idx + 1
+        if end < len(seq) and seq[end] < seq[idx]:
+            while end < len(seq) and seq[end] < seq[end - 1]:
+                end += 1
+            left, right = idx, end - 1
+            while left < right:
+                seq[left], seq[right] = seq[right], seq[left]
+                left += 1
+                right -= 1
         else:
-            times = repeat(stmt=f"sorted({seq.copy()})", repeat=rep, number=num_times)
-        return min(times)
-
-    print(f"Call sorting function {num_times} time(s) and repeat {rep} time(s) each for a total of "
-          f"{num_times * rep} calls")
-    print("Type of sort: Sorted or not: Min time (seconds)")
-    print(f"Unsorted seq: {seq == system_sort}, number of elements: {len(seq)}")
-    print(f"System sort: True : {min_time('sorted')}")
-    print(f"Selection sort: {selection == system_sort} : {min_time('selection_sort')}")
-    print(f"Insertion sort: {insertion == system_sort} : {min_time('insertion_sort')}")
-    print(f"Shell sort: {shell == system_sort} : {min_time('shell_sort')}")
-    print(f"Merge sort: {merge == system_sort} : {min_time('merge_sort')}")
-    print(f"Merge sort with cutoff: {merge_with_cutoff == system_sort} : {min_time('merge_sort', cutoff=cutoff)}")
-    print(f"Quick sort: {quick == system_sort} : {min_time('quick_sort')}")
-    print(f"Quick sort with cutoff: {quick_with_cutoff == system_sort} : {min_time('quick_sort', cutoff=cutoff)}")
-    print(f"Three way quick sort: {three_way_quick == system_sort} : {min_time('three_way_quick_sort')}")
-    print(f"Three way quick sort with cutoff: {three_way_quick_with_cutoff == system_sort} :"
-          f"{min_time('three_way_quick_sort', cutoff=cutoff)}")
-    print(f"Heap sort: {heap == system_sort} : {min_time('heap_sort')}")
-    print(f"Heap with heapq sort: {heapq_result == system_sort} : {min_time('heapq_sort')}", end="\n\n")
+            while end < len(seq) and not seq[end] < seq[end - 1]:
+                end += 1
+        idx = end
+
+    return runs
+
+
+def _merge_into(src, dst, lo, mid, hi):
+    """Merge sorted src[lo:mid] and src[mid:hi] into dst[lo:hi] (stable)."""
+    # Adjacent runs already in order are copied across without comparing each element.
+    if not src[mid] < src[mid - 1]:
+        dst[lo:hi] = src[lo:hi]
+        return
+
+    # Hold the head of each run in a local so each element is only read from src once.
+    left, right, idx = lo, mid, lo
+    left_elem, right_elem = src[left], src[right]
+    while True:
+        if right_elem < left_elem:
+            dst[idx] = right_elem
+            idx += 1
+            right += 1
+            if right == hi:
+                dst[idx:hi] = src[left:mid]
+                return
+            right_elem = src[right]
+        else:
+            dst[idx] = left_elem
+            idx += 1
+            left += 1
+            if left == mid:
+                dst[idx:hi] = src[right:hi]
+                return
+            left_elem = src[left]
+
+
+def _merge_runs(seq, runs):
+    """Merge adjacent ascending runs pairwise, swapping the roles of seq and its buffer each pass."""
+    bounds = runs + [len(seq)]
+    src, dst = seq, seq[:]
+    while len(bounds) > 2:
+        merged = [0]
+        for idx in range(0, len(bounds) - 1, 2):
+            if idx + 2 < len(bounds):
+                _merge_into(src, dst, bounds[idx], bounds[idx + 1], bounds[idx + 2])
+                merged.append(bounds[idx + 2])
+            else:
+                # Odd run out. Carry it across to the next pass.
+                dst[bounds[idx]:bounds[idx + 1]] = src[bounds[idx]:bounds[idx + 1]]
+                merged.append(bounds[idx + 1])
+        src, dst = dst, src
+        bounds = merged
+
+    if src is not seq:
+        seq[:] = src
+
+
+# O(n) for sorted, reversed or otherwise run-structured input. O(nlogn) worst case as recursion that
+# goes too deep falls back to heapsort. O(n) best case with equal keys. O(logn) space for recursion
+# and O(n) space when merging runs. Not stable.
+@_keyed
+def hybrid_sort(seq, cutoff=16, min_run=32):
+    """Merge natural runs if seq is nearly sorted, otherwise introsort with three-way partitioning."""
+    if len(seq) < 2:
+        return seq
+
+    # Input with an average run length of at least min_run is cheaper to merge than to partition.
+    # Unlike quick_sort, seq is never shuffled so existing order is not thrown away.
+    runs = _natural_runs(seq, max_runs=max(1, len(seq) // min_run))
+    if runs is not None:
+        _merge_runs(seq, runs)
+        return seq
+
+    def sort(lo, hi, depth):
+        """Partition around a median of three pivot, looping on the larger side to bound the stack."""
+        while hi - lo > cutoff:
+            if depth == 0:
+                # Too many unbalanced partitions. Heapsort guarantees O(nlogn) for this range.
+                _heap_sort_range(seq, lo, hi)
+                return
+            depth -= 1
+
+            _median_of_three(seq, lo, hi)
+            partition_idx, from_right = _three_way_partition(seq, lo, hi)
+            if partition_idx - lo < hi - from_right:
+                sort(lo, partition_idx - 1, depth)
+                lo = from_right + 1
+            else:
+                sort(from_right + 1, hi, depth)
+                hi = partition_idx - 1
+
+        _insertion_sort_range(seq, lo, hi)
+
+    sort(0, len(seq) - 1, depth=2 * len(seq).bit_length())
+    return seq
+
+
+def _sort_shared_chunk(name, typecode, length, lo, hi, sort):
+    """Sort elements lo to hi of the array held in the shared memory block called name."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        with shm.buf[:length * array(typecode).itemsize] as buf, buf.cast(typecode) as view:
+            view[lo:hi] = array(typecode, sort(view[lo:hi].tolist()))
+    finally:
+        shm.close()
+
+
+# O((n/workers)log(n/workers)) to sort chunks in parallel and O(nlog(workers)) to merge them.
+@_keyed
+def parallel_sort(seq, sort=merge_sort, workers=None, min_chunk_size=10_000):
+    """Sort chunks of seq in separate processes with sort, then k-way merge the sorted chunks."""
+    chunk_size = max(min_chunk_size, -(-len(seq) // (workers or os.cpu_count())))
+    if len(seq) <= chunk_size:
+        return sort(seq)
+
+    bounds = [(lo, min(lo + chunk_size, len(seq))) for lo in range(0, len(seq), chunk_size)]
+    typecode = _numeric_typecode(seq)
+    with ProcessPoolExecutor(max_workers=len(bounds)) as executor:
+        if typecode is None:
+            # Elements that don't fit in a C array have to be pickled across to the workers.
+            chunks = list(executor.map(sort, (seq[lo:hi] for lo, hi in bounds)))
+        else:
+            # Numbers are copied once into shared memory and each worker sorts its chunk in place,
+            # so only the name of the block and the chunk bounds are pickled.
+            values = seq if isinstance(seq, array) else array(typecode, seq)
+            shm = shared_memory.SharedMemory(create=True, size=len(values) * values.itemsize)
+            try:
+                with shm.buf[:len(values) * values.itemsize] as buf:
+                    buf[:] = memoryview(values).cast("B")
+                    futures = [executor.submit(_sort_shared_chunk, shm.name, typecode, len(values),
+                                               lo, hi, sort)
+                               for lo, hi in bounds]
+                    for future in futures:
+                        future.result()
+
+                    with buf.cast(typecode) as view:
+                        values = view.tolist()
+            finally:
+                shm.close()
+                shm.unlink()
+            chunks = [values[lo:hi] for lo, hi in bounds]
+
+    _write_back(seq, list(heapq.merge(*chunks)))
+    return seq
+
 
 if __name__ == "__main__":
-    print("Random array")
-    main([random.randint(0, 10**4) for _ in range(5)])
-    print("Random array")
-    main([random.randint(0, 10**3) for _ in range(50)])
-    print("Random array with duplicates")
-    main([random.randint(0, 50) for _ in range(500)])
-    print("Sorted array")
-    main([elem for elem in range(500)])
-    print("Random array")
-    main([random.randint(0, 10**8) for _ in range(5000)])
-    print("Random array with duplicates")
-    main([random.randint(0, 50) for _ in range(5000)])
-    print("Reverse array")
-    main([elem for elem in range(5000, 0, -1)])
-    print("Random array")
-    main([random.randint(0, 10**20) for _ in range(10000)])
-    print("Reverse array")
-    main([elem for elem in range(10000, 0, -1)])
+    import sys
+
+    from python_dsa.algorithms.benchmark import main
+    main(["sort", *sys.argv[1:]])
@@ -1,47 +1,242 @@
-# Rabin-Karp with Binary Search on string to find repeating substrings.
+# Substring search with Rabin-Karp, Knuth-Morris-Pratt and Boyer-Moore-Horspool (Algorithms, 5.3).
+import random
+from collections import defaultdict
 
-def longestRepeatingSubstring(self, s: str) -> int:
-    """O(MlogM) time and O(M) space where M is length of string."""
+# Hashes are kept modulo a Mersenne prime so they stay a fixed size however long the window is. The
+# radix is random so no fixed input can be built to collide, and every hash match is verified
+# against the text, so a collision only costs time (the Las Vegas version of Rabin-Karp).
+_MODULUS = (1 << 61) - 1
+_RADIX = random.randrange(1 << 32, _MODULUS)
 
-    start = ord("a")
-    unique = 26
 
-    # O(M) time where M is length of s. O(M) space at worst for
-    # hashset.
-    def rabin_karp(length):
+def _codes(text):
+    """Return a sequence of the character codes of text, which may be str or bytes."""
+    if isinstance(text, str):
+        # Four bytes per character, rather than a list of ints or a slice per window.
+        return memoryview(text.encode("utf-32-le")).cast("I")
+    return memoryview(text).cast("B")
 
-        seen = set()
 
-        value = 0
-        for idx in range(length):
-            value += (ord(s[idx]) - start) * (unique ** idx)
+def _hash(codes, length):
+    """Hash of the first length codes."""
+    value = 0
+    for idx in range(length):
+        value = (value * _RADIX + codes[idx]) % _MODULUS
+    return value
 
-        seen.add(value)
 
-        for idx in range(length, len(s)):
-            value -= (ord(s[idx - length]) - start)
-            value //= unique
-            value += (ord(s[idx]) - start) * (unique ** (length - 1))
+def _windows(codes, length):
+    """Yield (idx, hash) for every window of length codes, rolling the hash along one at a time."""
+    if length > len(codes):
+        return
+    # _RADIX ** (length - 1), the weight of the code leaving the window.
+    leading = pow(_RADIX, length - 1, _MODULUS)
+    value = _hash(codes, length)
+    yield 0, value
+    for idx in range(length, len(codes)):
+        value = ((value - codes[idx - length] * leading) * _RADIX + codes[idx]) % _MODULUS
+        yield idx - length + 1, value
 
-            if value in seen:
-                return True
 
-            seen.add(value)
-        #print(seen, length, s)
-        return False
+# O(n + m) expected time for text of length n and pattern of length m. O(1) extra space.
+def search_all(text, pattern):
+    """Yield the index of every (possibly overlapping) occurrence of pattern in text."""
+    if not pattern:
+        yield from range(len(text) + 1)
+        return
+
+    target = _hash(_codes(pattern), len(pattern))
+    for idx, value in _windows(_codes(text), len(pattern)):
+        if value == target and text[idx : idx + len(pattern)] == pattern:
+            yield idx
+
+
+def search(text, pattern):
+    """Return the index of the first occurrence of pattern in text, or -1 if there isn't one."""
+    return next(search_all(text, pattern), -1)
+
+
+# O(n + total length of patterns + verified matches) expected time. O(number of patterns) space.
+def multi_search(text, patterns):
+    """Yield (idx, pattern) for every occurrence of any of patterns in text, in order of idx.
+
+    A single rolling hash over windows as long as the shortest pattern is looked up in a table of
+    the hashes of each pattern's prefix of that length. Only windows that hit the table are
+    verified against the patterns sharing that prefix hash.
+    """
+    patterns = [pattern for pattern in dict.fromkeys(patterns) if pattern]
+    if not patterns:
+        return
+    length = min(len(pattern) for pattern in patterns)
+
+    candidates = defaultdict(list)
+    for pattern in patterns:
+        candidates[_hash(_codes(pattern), length)].append(pattern)
+
+    for idx, value in _windows(_codes(text), length):
+        for pattern in candidates.get(value, ()):
+            if text[idx : idx + len(pattern)] == pattern:
+                yield idx, pattern
+
+
+class Pattern:
+    """A str or bytes pattern compiled once for exact matching against many texts or streams.
+
+    Two algorithms are available, each with its table built up front:
+
+    - "horspool" (Boyer-Moore-Horspool) compares from the end of the pattern and skips ahead by the
+      shift of the text character under the pattern's last position. On large alphabets most
+      shifts are the whole pattern length, so on average it reads only n/m characters.
+    - "kmp" (Knuth-Morris-Pratt) reads every character exactly once and never backs up, falling
+      back along a failure table on a mismatch. Its worst case is linear, which suits streams.
+    """
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        length = len(pattern)
+
+        # failure[idx] is the length of the longest proper prefix of pattern[:idx + 1] that is also
+        # a suffix of it, i.e. how much of a match survives a mismatch after idx + 1 characters.
+        self.failure = [0] * length
+        matched = 0
+        for idx in range(1, length):
+            while matched and pattern[idx] != pattern[matched]:
+                matched = self.failure[matched - 1]
+            if pattern[idx] == pattern[matched]:
+                matched += 1
+            self.failure[idx] = matched
+
+        # How far the pattern can move when char is under its last position. Characters that don't
+        # occur before the last position shift it by the whole length.
+        self.shift = {char: length - 1 - idx for idx, char in enumerate(pattern[:-1])}
+
+    def __len__(self):
+        return len(self.pattern)
 
+    # O(nm) time worst case, O(n/m) on average for large alphabets.
+    def _horspool(self, text):
+        pattern, shift, length = self.pattern, self.shift, len(self.pattern)
+        last = pattern[-1]
+        idx = 0
+        while idx <= len(text) - length:
+            char = text[idx + length - 1]
+            if char == last and text[idx : idx + length] == pattern:
+                yield idx
+            idx += shift.get(char, length)
 
-    # O(logM) time binary search over lengths to find
-    # largest length repeating substring.
+    # O(n) time.
+    def _kmp(self, text, state):
+        """Yield the end index of every match in text, starting with state characters already
+        matched. state[0] is updated so that matching can continue in the next chunk."""
+        pattern, failure, length = self.pattern, self.failure, len(self.pattern)
+        matched = state[0]
+        for idx, char in enumerate(text):
+            while matched and char != pattern[matched]:
+                matched = failure[matched - 1]
+            if char == pattern[matched]:
+                matched += 1
+                if matched == length:
+                    yield idx + 1
+                    matched = failure[matched - 1]
+        state[0] = matched
+
+    def finditer(self, text, algorithm="horspool"):
+        """Yield the index of every (possibly overlapping) occurrence of the pattern in text."""
+        return self.finditer_chunks((text,), algorithm)
+
+    def finditer_chunks(self, chunks, algorithm="horspool"):
+        """Yield the index in the whole stream of every occurrence of the pattern in chunks.
+
+        chunks is any iterable of str or bytes pieces, such as the blocks read from a file, and
+        matches that span chunk boundaries are found. KMP carries its matched length over from one
+        chunk to the next, while Horspool keeps the last len(pattern) - 1 characters.
+        """
+        if algorithm not in ("horspool", "kmp"):
+            raise ValueError(f"Unknown algorithm {algorithm!r}, expected 'horspool' or 'kmp'")
+        length = len(self.pattern)
+        if not length:
+            # The empty pattern occurs at every position of the stream, including the end.
+            offset = 0
+            for chunk in chunks:
+                yield from range(offset, offset + len(chunk))
+                offset += len(chunk)
+            yield offset
+            return
+
+        if algorithm == "kmp":
+            offset, state = 0, [0]
+            for chunk in chunks:
+                for end in self._kmp(chunk, state):
+                    yield offset + end - length
+                offset += len(chunk)
+            return
+
+        # offset is the index in the stream of the start of buffer.
+        offset, buffer = 0, self.pattern[:0]
+        for chunk in chunks:
+            buffer += chunk
+            for idx in self._horspool(buffer):
+                yield offset + idx
+            # Every match found so far starts before the kept tail, so none is reported twice.
+            keep = min(len(buffer), length - 1)
+            offset += len(buffer) - keep
+            buffer = buffer[len(buffer) - keep :]
+
+    def search(self, text, algorithm="horspool"):
+        """Return the index of the first occurrence of the pattern in text, or -1."""
+        return next(self.finditer(text, algorithm), -1)
+
+
+# O(MlogM) expected time and O(M) space where M is length of string.
+def longest_repeating_substring(s):
+    """Return the length of the longest substring that occurs in s at least twice.
+
+    To ask this (or where substrings occur) of the same text repeatedly, build a SuffixArray once.
+    """
+    codes = _codes(s)
+
+    # O(M) expected time. O(M) space at worst for the hashes seen so far.
+    def has_repeat(length):
+        seen = defaultdict(list)
+        for idx, value in _windows(codes, length):
+            window = s[idx : idx + length]
+            # Compare against earlier windows with the same hash so that collisions don't count.
+            if any(s[other : other + length] == window for other in seen[value]):
+                return True
+            seen[value].append(idx)
+        return False
+
+    # O(logM) binary search over lengths. If a substring repeats, so do all its prefixes.
     max_length = 0
-    lo, hi = 0, len(s) - 1
+    lo, hi = 1, len(s) - 1
     while lo <= hi:
         length = (lo + hi) // 2
 
-        if rabin_karp(length):
+        if has_repeat(length):
             max_length = length
             lo = length + 1
         else:
             hi = length - 1
 
     return max_length
+
+
+if __name__ == "__main__":
+    print(search("abracadabra", "cad"))
+    print(search("abracadabra", "dab"))
+    print(search("abracadabra", "bad"))
+    print(list(search_all("abracadabra", "abra")))
+    print(search(b"GET /index.html HTTP/1.1", b"HTTP"))
+    print(search("naïve café", "café"))
+
+    log = "ERROR disk full\nWARN retrying\nERROR timeout\n"
+    print(list(multi_search(log, ["ERROR", "WARN", "timeout", "disk"])))
+
+    pattern = Pattern("ERROR")
+    print(pattern.search(log), list(pattern.finditer(log, algorithm="kmp")))
+    print(list(pattern.finditer_chunks(log[idx : idx + 4] for idx in range(0, len(log), 4))))
+
+    print(longest_repeating_substring("abcd"))
+    print(longest_repeating_substring("abbaba"))
+    print(longest_repeating_substring("aabcaabdaab"))
+    print(longest_repeating_substring("aaaaa"))
@@ -0,0 +1,139 @@
+# Suffix array and LCP array of a string, for repeated substring and substring queries.
+from array import array
+
+from python_dsa.algorithms.strings import _codes
+
+
+# O(nlog^2n) time. O(n) space.
+def _suffix_array(codes):
+    """Return the start indices of the suffixes of codes in sorted order, by prefix doubling."""
+    n = len(codes)
+    suffixes = sorted(range(n), key=codes.__getitem__)
+    rank, distinct = _rank(suffixes, codes)
+
+    # Suffixes are sorted on their first length characters. Sorting on (rank of the first length,
+    # rank of the next length) sorts them on their first 2 * length, until every rank is distinct.
+    length = 1
+    while distinct < n:
+        # Pack the pair into one int, with suffixes that end first sorting first, since sorting
+        # ints is much faster than sorting tuples. suffixes is already in order of the first rank,
+        # which the sort takes advantage of.
+        keys = [first * (n + 1) + second + 1 for first, second in zip(rank, rank[length:])]
+        keys.extend(first * (n + 1) for first in rank[n - length :])
+        suffixes.sort(key=keys.__getitem__)
+        rank, distinct = _rank(suffixes, keys)
+        length *= 2
+
+    return suffixes
+
+
+def _rank(suffixes, keys):
+    """Rank each suffix by its key, given suffixes sorted by key. Returns the ranks and how many
+    distinct keys there are."""
+    rank = [0] * len(suffixes)
+    distinct, previous = 0, None
+    for idx in suffixes:
+        key = keys[idx]
+        if key != previous:
+            distinct += 1
+            previous = key
+        rank[idx] = distinct - 1
+    return rank, distinct
+
+
+# O(n) time. O(n) space.
+def _lcp_array(codes, suffixes):
+    """Return the length of the longest common prefix of each suffix and the one before it (Kasai).
+
+    Moving from suffix idx to idx + 1 in the text loses at most one character of common prefix, so
+    the matched length only drops by one at each step and the total work is linear.
+    """
+    n = len(codes)
+    rank = [0] * n
+    for position, idx in enumerate(suffixes):
+        rank[idx] = position
+
+    lcp = [0] * n
+    matched = 0
+    for idx in range(n):
+        if rank[idx] == 0:
+            matched = 0
+            continue
+        previous = suffixes[rank[idx] - 1]
+        while (idx + matched < n and previous + matched < n
+               and codes[idx + matched] == codes[previous + matched]):
+            matched += 1
+        lcp[rank[idx]] = matched
+        matched = max(matched - 1, 0)
+    return lcp
+
+
+class SuffixArray:
+    """Index of every suffix of a str or bytes text in sorted order, with their common prefixes.
+
+    Building the index is O(nlog^2n). After that each query is O(mlogn) for a pattern of length m,
+    however many times it is asked.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        codes = _codes(text)
+        # Start index of each suffix, in sorted order.
+        self.suffixes = array("l", _suffix_array(codes))
+        # lcp[idx] is the length of the longest common prefix of suffixes idx - 1 and idx.
+        self.lcp = array("l", _lcp_array(codes, self.suffixes))
+
+    def __len__(self):
+        return len(self.text)
+
+    def _bound(self, pattern, strict):
+        """Return the position of the first suffix whose prefix is greater than (strict) or at
+        least pattern."""
+        lo, hi = 0, len(self.suffixes)
+        while lo < hi:
+            mid = (hi + lo) // 2
+            start = self.suffixes[mid]
+            prefix = self.text[start : start + len(pattern)]
+            if prefix < pattern or strict and prefix == pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _range(self, pattern):
+        """Return the range of positions of the suffixes that start with pattern."""
+        return self._bound(pattern, strict=False), self._bound(pattern, strict=True)
+
+    # O(mlogn) time.
+    def count(self, pattern):
+        """Return the number of (possibly overlapping) occurrences of pattern in the text."""
+        lo, hi = self._range(pattern)
+        return hi - lo
+
+    # O(mlogn + klogk) time for k occurrences.
+    def locate(self, pattern):
+        """Return the indices of every occurrence of pattern in the text, in increasing order."""
+        lo, hi = self._range(pattern)
+        return sorted(self.suffixes[lo:hi])
+
+    # O(n) time.
+    def longest_repeated_substring(self):
+        """Return the longest substring that occurs in the text at least twice."""
+        if len(self.lcp) < 2:
+            return self.text[:0]
+        position = max(range(len(self.lcp)), key=self.lcp.__getitem__)
+        start = self.suffixes[position]
+        return self.text[start : start + self.lcp[position]]
+
+
+if __name__ == "__main__":
+    index = SuffixArray("banana")
+    print(list(index.suffixes))
+    print(list(index.lcp))
+    print(index.longest_repeated_substring())
+    print(index.count("ana"), index.locate("ana"))
+    print(index.count("nab"), index.locate("nab"))
+
+    index = SuffixArray(b"it was the best of times it was the worst of times")
+    print(index.longest_repeated_substring())
+    print(index.locate(b"times"))
@@ -3,3 +3,5 @@ from python_dsa.graph.directed_graph import *
 from python_dsa.graph.directed_graph_recursive import *
 from python_dsa.graph.edge_graph import *
 
+from python_dsa.graph.csr_graph import *
+from python_dsa.graph.loaders import *
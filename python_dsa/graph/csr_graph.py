@@ -0,0 +1,354 @@
+# Immutable graph in compressed sparse row (CSR) form, with adjacency packed into flat arrays.
+import collections
+import itertools
+import mmap
+import struct
+import sys
+from array import array
+
+from python_dsa.graph.directed_graph import DiGraph
+from python_dsa.graph.directed_graph_recursive import DiGraphRecursive
+from python_dsa.graph.edge_graph import Edge, EdgeWeightedGraph
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Saved graphs start with this header: a magic number, the format version, flags, the number of
+# vertices and the number of targets. Then come the offsets and targets as int64 and, if the
+# weighted flag is set, the weights as float64, all little endian. The header is a multiple of 8
+# bytes so that every array is aligned for reading in place.
+_MAGIC = b"PYDSACSR"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIqq")
+_DIRECTED, _WEIGHTED = 1, 2
+
+
+def _write_column(out, values, typecode):
+    """Write values to out as little endian 8 byte typecode numbers."""
+    if sys.byteorder == "little" and memoryview(values).itemsize == 8:
+        out.write(values)
+    else:
+        column = array(typecode, values)
+        if sys.byteorder == "big":
+            column.byteswap()
+        out.write(column)
+
+
+def _to_array(values):
+    """Copy a NumPy array into an array("l")."""
+    result = array("l")
+    result.frombytes(values.astype("l").tobytes())
+    return result
+
+
+class _Adjacency:
+    """Read only view of a CSRGraph's adjacency lists, indexed like Graph.adj."""
+
+    def __init__(self, offsets, targets):
+        self._offsets = offsets
+        self._targets = targets
+
+    def __getitem__(self, vertex):
+        # Slicing a memoryview doesn't copy, and iterating it gives plain ints.
+        return self._targets[self._offsets[vertex] : self._offsets[vertex + 1]]
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __iter__(self):
+        return (self[vertex] for vertex in range(len(self)))
+
+
+class CSRGraph:
+    """Directed or undirected graph whose adjacency lists can't change once built.
+
+    The neighbours of vertex v are targets[offsets[v]:offsets[v + 1]], with both stored as
+    array("l"), so every edge endpoint costs one machine word rather than a pointer to a boxed int
+    in a list per vertex, and the neighbours of consecutive vertices are next to each other in
+    memory. Weighted graphs also have weights, with the weight of each edge at the same index as
+    its target. Undirected graphs store each edge in both directions, like Graph. Build one with
+    from_edges, from_arrays, from_adjacency or from_graph, or load one saved with save.
+    """
+
+    def __init__(self, offsets, targets, directed=True, weights=None):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+        self.adj = _Adjacency(memoryview(offsets), memoryview(targets))
+        self.num_edges = len(targets) if directed else len(targets) // 2
+        # Set for graphs opened from a file, which are then pickled by path rather than contents.
+        self.path = None
+        # The mapping of a graph opened with load, and the views into it that close releases.
+        self._map, self._views = None, ()
+
+    # O(V + E) time.
+    @classmethod
+    def from_arrays(cls, num_vertices, sources, targets, directed=True, weights=None):
+        """Build a graph from the edges (sources[idx], targets[idx]) in bulk.
+
+        sources and targets are equal length arrays (or sequences) of vertices, and weights, if
+        given, of their weights. Neighbours are kept in the order their edges are given, as
+        add_edge would, by counting the edges out of each vertex and then placing each edge at its
+        vertex's next free slot.
+        """
+        sources = array("l", sources)
+        targets = array("l", targets)
+        weights = None if weights is None else array("d", weights)
+        if len(sources) != len(targets) or weights is not None and len(weights) != len(sources):
+            raise ValueError("sources, targets and weights must be the same length")
+        if sources and (min(min(sources), min(targets)) < 0
+                        or max(max(sources), max(targets)) >= num_vertices):
+            raise IndexError("Edge vertex out of range")
+
+        if not directed:
+            # Interleave the reversed edges so each vertex's neighbours are in the same order as
+            # Graph.add_edge would give them.
+            both_sources = array("l", bytes(2 * len(sources) * sources.itemsize))
+            both_targets = array("l", bytes(2 * len(sources) * sources.itemsize))
+            both_sources[::2] = both_targets[1::2] = sources
+            both_sources[1::2] = both_targets[::2] = targets
+            sources, targets = both_sources, both_targets
+            if weights is not None:
+                both_weights = array("d", bytes(2 * len(weights) * weights.itemsize))
+                both_weights[::2] = both_weights[1::2] = weights
+                weights = both_weights
+
+        if np is not None:
+            source_array = np.frombuffer(sources, dtype="l")
+            order = np.argsort(source_array, kind="stable")
+            offsets = np.zeros(num_vertices + 1, dtype="l")
+            np.cumsum(np.bincount(source_array, minlength=num_vertices), out=offsets[1:])
+            if weights is not None:
+                weights = array("d", np.frombuffer(weights, dtype="d")[order].tobytes())
+            return cls(_to_array(offsets), _to_array(np.frombuffer(targets, dtype="l")[order]),
+                       directed, weights)
+
+        offsets = array("l", bytes((num_vertices + 1) * sources.itemsize))
+        for vertex in sources:
+            offsets[vertex + 1] += 1
+        for vertex in range(num_vertices):
+            offsets[vertex + 1] += offsets[vertex]
+
+        next_slot = offsets[:-1]
+        sorted_targets = array("l", bytes(len(targets) * targets.itemsize))
+        if weights is None:
+            for from_vertex, to_vertex in zip(sources, targets):
+                sorted_targets[next_slot[from_vertex]] = to_vertex
+                next_slot[from_vertex] += 1
+            return cls(offsets, sorted_targets, directed)
+
+        sorted_weights = array("d", bytes(len(weights) * weights.itemsize))
+        for from_vertex, to_vertex, weight in zip(sources, targets, weights):
+            sorted_targets[next_slot[from_vertex]] = to_vertex
+            sorted_weights[next_slot[from_vertex]] = weight
+            next_slot[from_vertex] += 1
+        return cls(offsets, sorted_targets, directed, sorted_weights)
+
+    @classmethod
+    def from_edges(cls, num_vertices, edges, directed=True):
+        """Build a graph from an iterable of (from_vertex, to_vertex) edges in bulk."""
+        sources, targets = array("l"), array("l")
+        for from_vertex, to_vertex in edges:
+            sources.append(from_vertex)
+            targets.append(to_vertex)
+        return cls.from_arrays(num_vertices, sources, targets, directed)
+
+    @classmethod
+    def from_adjacency(cls, adj, directed=True):
+        """Pack the adjacency lists of an existing graph, e.g. CSRGraph.from_adjacency(graph.adj).
+
+        For an undirected Graph, pass directed=False. Its lists already hold both directions.
+        """
+        offsets = array("l", itertools.accumulate((len(neighbours) for neighbours in adj),
+                                                  initial=0))
+        return cls(offsets, array("l", itertools.chain.from_iterable(adj)), directed)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Pack a Graph, DiGraph, DiGraphRecursive or EdgeWeightedGraph (or CSRGraph)."""
+        if isinstance(graph, CSRGraph):
+            return graph
+        if isinstance(graph, EdgeWeightedGraph):
+            offsets = array("l", itertools.accumulate(map(len, graph.adj), initial=0))
+            edges = list(itertools.chain.from_iterable(graph.adj))
+            # Each edge is in the lists of both of its vertices, so find which end is which.
+            sources = itertools.chain.from_iterable(
+                itertools.repeat(vertex, len(vertex_edges))
+                for vertex, vertex_edges in enumerate(graph.adj))
+            targets = array("l", map(Edge.other, edges, sources))
+            return cls(offsets, targets, False, array("d", (edge.weight for edge in edges)))
+        directed = isinstance(graph, (DiGraph, DiGraphRecursive))
+        return cls.from_adjacency(graph.adj, directed)
+
+    @property
+    def num_vertices(self):
+        return len(self.offsets) - 1
+
+    def degree(self, vertex):
+        return self.offsets[vertex + 1] - self.offsets[vertex]
+
+    def edges(self, vertex):
+        return iter(self.adj[vertex])
+
+    def edge_weights(self, vertex):
+        """Return the weights of the edges of vertex, in the same order as adj[vertex]."""
+        return memoryview(self.weights)[self.offsets[vertex] : self.offsets[vertex + 1]]
+
+    def reverse(self):
+        """Returns a new CSRGraph with directions reversed.
+
+        An undirected graph already holds every edge both ways, so it is its own reverse and is
+        returned as it is (CSRGraphs are never modified).
+        """
+        if not self.directed:
+            return self
+        sources = array("l", itertools.chain.from_iterable(
+            itertools.repeat(vertex, self.degree(vertex)) for vertex in range(self.num_vertices)))
+        return CSRGraph.from_arrays(self.num_vertices, self.targets, sources, self.directed,
+                                    self.weights)
+
+    def bfs(self, source):
+        # A byte per vertex rather than a set of boxed ints. Vertices are marked when they are
+        # queued, so each one is queued once and the order matches Graph.bfs.
+        visited = bytearray(self.num_vertices)
+        visited[source] = True
+
+        queue = collections.deque([source])
+        while queue:
+            vertex = queue.popleft()
+            yield vertex
+
+            for adjacent_vertex in self.adj[vertex]:
+                if not visited[adjacent_vertex]:
+                    visited[adjacent_vertex] = True
+                    queue.append(adjacent_vertex)
+
+    def dfs(self, source):
+        visited = bytearray(self.num_vertices)
+        stack = [source]
+
+        while stack:
+            vertex = stack.pop()
+            # As in Graph.dfs, vertices can be on the stack more than once and are skipped if they
+            # were visited after being pushed.
+            if not visited[vertex]:
+                visited[vertex] = True
+                yield vertex
+
+                for adjacent_vertex in self.adj[vertex]:
+                    if not visited[adjacent_vertex]:
+                        stack.append(adjacent_vertex)
+
+    def __str__(self):
+        return str([list(neighbours) for neighbours in self.adj])
+
+    def __reduce__(self):
+        # Worker processes reopen a saved graph and share its pages rather than copying it.
+        if self.path is not None:
+            return CSRGraph.load, (self.path,)
+        return CSRGraph, (self.offsets, self.targets, self.directed, self.weights)
+
+    def save(self, path):
+        """Save the graph in a binary format that load can map without reading it."""
+        flags = _DIRECTED * self.directed | _WEIGHTED * (self.weights is not None)
+        with open(path, "wb") as graph_file:
+            graph_file.write(_HEADER.pack(_MAGIC, _VERSION, flags, self.num_vertices,
+                                          len(self.targets)))
+            _write_column(graph_file, self.offsets, "q")
+            _write_column(graph_file, self.targets, "q")
+            if self.weights is not None:
+                _write_column(graph_file, self.weights, "d")
+
+    @classmethod
+    def load(cls, path):
+        """Open a graph saved with save, without reading or copying it.
+
+        The file is memory mapped and the graph's arrays are memoryviews into the mapping, so it
+        is usable immediately whatever its size, and pages are only read as they are touched.
+        Every process that loads the same file shares its pages through the page cache.
+        """
+        with open(path, "rb") as graph_file:
+            mapped = mmap.mmap(graph_file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        if len(view) < _HEADER.size:
+            raise ValueError(f"{path} is not a saved graph")
+        magic, version, flags, num_vertices, num_targets = _HEADER.unpack_from(view)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} is not a saved graph (or is from another version)")
+
+        columns, start = [], _HEADER.size
+        for length, typecode in ((num_vertices + 1, "q"), (num_targets, "q"),
+                                 (num_targets if flags & _WEIGHTED else 0, "d")):
+            if start + 8 * length > len(view):
+                raise ValueError(f"{path} is truncated")
+            column = view[start : start + 8 * length].cast(typecode)
+            if sys.byteorder == "big":
+                column = array(typecode, column)
+                column.byteswap()
+            columns.append(column)
+            start += 8 * length
+
+        offsets, targets, weights = columns
+        graph = cls(offsets, targets, bool(flags & _DIRECTED),
+                    weights if flags & _WEIGHTED else None)
+        graph.path = path
+        graph._map = mapped
+        graph._views = [graph.adj._offsets, graph.adj._targets, *columns, view]
+        return graph
+
+    def close(self):
+        """Unmap the file of a graph opened with load, after which the graph can't be used.
+
+        Raises BufferError if views of its adjacency lists or weights are still held elsewhere.
+        Does nothing for graphs built in memory.
+        """
+        if self._map is None:
+            return
+        for view in self._views:
+            if isinstance(view, memoryview):
+                view.release()
+        self._map.close()
+        self._map, self._views = None, ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def save_graph(graph, path):
+    """Save a Graph, DiGraph, DiGraphRecursive, EdgeWeightedGraph or CSRGraph for CSRGraph.load."""
+    CSRGraph.from_graph(graph).save(path)
+
+
+if __name__ == "__main__":
+    edges = ((2, 5), (2, 4), (2, 3), (4, 3), (4, 1), (5, 0), (1, 0))
+    graph = CSRGraph.from_edges(6, edges)
+    print(graph)
+    print(list(graph.offsets), list(graph.targets))
+    print(graph.num_vertices, graph.num_edges)
+    print(*graph.dfs(2))
+    print(*graph.bfs(2))
+    print(graph.reverse())
+
+    graph = CSRGraph.from_edges(5, ((0, 1), (2, 3), (4, 2)), directed=False)
+    print(graph)
+    print(*graph.edges(2))
+
+    import os
+    import tempfile
+
+    weighted_graph = EdgeWeightedGraph(5)
+    for edge in (Edge(0, 1, 0.4), Edge(1, 2, 1.7), Edge(1, 3, 2.4), Edge(0, 4, 1.5)):
+        weighted_graph.add_edge(edge)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "graph.csr")
+        save_graph(weighted_graph, path)
+        with CSRGraph.load(path) as graph:
+            print(graph, graph.num_edges)
+            print(list(graph.edge_weights(1)))
@@ -0,0 +1,230 @@
+# Bulk loading of graphs from text and binary edge list files.
+import itertools
+import struct
+import sys
+from array import array
+
+from python_dsa.graph.csr_graph import CSRGraph
+from python_dsa.graph.directed_graph import DiGraph
+from python_dsa.graph.directed_graph_recursive import DiGraphRecursive
+from python_dsa.graph.edge_graph import Edge, EdgeWeightedGraph
+from python_dsa.graph.undirected_graph import Graph
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _text_chunks(path, chunk_size):
+    """Yield the contents of a file in chunks of about chunk_size bytes, split at line ends."""
+    with open(path, "rb") as edge_file:
+        tail = b""
+        while True:
+            chunk = edge_file.read(chunk_size)
+            if not chunk:
+                break
+            chunk = tail + chunk
+            end = chunk.rfind(b"\n") + 1
+            tail = chunk[end:]
+            if end:
+                yield chunk[:end]
+        if tail:
+            yield tail
+
+
+def _bad_line(path, rows, first_line, columns, weighted):
+    """Return a ValueError naming the first of rows whose vertices or weight can't be parsed."""
+    for idx, row in enumerate(rows):
+        if not row:
+            continue
+        try:
+            int(row[0]), int(row[1])
+            if weighted:
+                float(row[2])
+        except ValueError:
+            return ValueError(f"Expected numbers on line {first_line + idx} of {path}, got "
+                              f"{b' '.join(row).decode(errors='replace')!r}")
+    return ValueError(f"Can't parse the edges of {path}")
+
+
+# O(E) time. O(E) space for the arrays and O(chunk_size) for the file.
+def read_edges(path, delimiter=None, weighted=False, comments="#", chunk_size=1 << 22):
+    """Parse a text edge list into arrays, returning (sources, targets, weights).
+
+    Each line is "from_vertex to_vertex", optionally followed by a weight and further fields, split
+    on whitespace or on delimiter (e.g. "," for CSV). Every line must have as many fields as the
+    first, and lines starting with comments are skipped. sources and targets are array("l"), and
+    weights is array("d") of the third fields if weighted, otherwise None. The file is read
+    chunk_size bytes at a time, and each chunk's fields are converted to numbers as a whole rather
+    than line by line. Raises ValueError naming the line if a line has the wrong number of fields
+    or fields that aren't numbers, such as a header line that doesn't start with comments.
+    """
+    delimiter = delimiter.encode() if isinstance(delimiter, str) else delimiter
+    comments = comments.encode() if isinstance(comments, str) else comments
+
+    sources, targets = array("l"), array("l")
+    weights = array("d") if weighted else None
+    columns = None
+    # The number of the first line of each chunk, counting from 1.
+    first_line = 1
+    for chunk in _text_chunks(path, chunk_size):
+        if delimiter:
+            chunk = chunk.replace(delimiter, b" ")
+        # A row of fields per line, with blank and comment lines left empty so that rows[idx] is
+        # line first_line + idx.
+        rows = list(map(bytes.split, chunk.split(b"\n")))
+        if comments and comments in chunk:
+            rows = [[] if row and row[0].startswith(comments) else row for row in rows]
+
+        if columns is None:
+            first_row = next((idx for idx, row in enumerate(rows) if row), None)
+            if first_row is not None:
+                columns = len(rows[first_row])
+                if columns < (3 if weighted else 2):
+                    raise ValueError(f"Too few fields on line {first_line + first_row} of {path}")
+        if not set(map(len, rows)) <= {0, columns}:
+            idx = next(idx for idx, row in enumerate(rows) if row and len(row) != columns)
+            raise ValueError(f"Expected {columns} fields on line {first_line + idx} of {path}, "
+                             f"like the first edge, got {len(rows[idx])}")
+
+        fields = list(itertools.chain.from_iterable(rows))
+        try:
+            sources.extend(map(int, fields[0::columns]))
+            targets.extend(map(int, fields[1::columns]))
+            if weighted:
+                weights.extend(map(float, fields[2::columns]))
+        except ValueError:
+            raise _bad_line(path, rows, first_line, columns, weighted) from None
+        first_line += len(rows) - 1
+
+    return sources, targets, weights
+
+
+# O(E) time. O(E) space for the arrays and O(chunk_size) for the file.
+def read_binary_edges(path, weighted=False, chunk_size=1 << 22):
+    """Read a binary edge file, returning (sources, targets, weights) like read_edges.
+
+    The file is a sequence of little endian records, each of two 8 byte vertices followed, if
+    weighted, by an 8 byte float weight, as written by write_binary_edges.
+    """
+    record_format = "<qqd" if weighted else "<qq"
+    record_size = struct.calcsize(record_format)
+    chunk_size = max(record_size, chunk_size - chunk_size % record_size)
+
+    sources, targets = array("q"), array("q")
+    weights = array("d") if weighted else None
+    with open(path, "rb") as edge_file:
+        while True:
+            chunk = edge_file.read(chunk_size)
+            if not chunk:
+                break
+            if len(chunk) % record_size:
+                raise ValueError(f"{path} is not a whole number of edge records")
+
+            if np is not None:
+                records = np.frombuffer(chunk, dtype=np.dtype(
+                    [("source", "<i8"), ("target", "<i8")] + [("weight", "<f8")] * weighted))
+                sources.frombytes(records["source"].astype("=i8").tobytes())
+                targets.frombytes(records["target"].astype("=i8").tobytes())
+                if weighted:
+                    weights.frombytes(records["weight"].astype("=f8").tobytes())
+            elif not weighted:
+                # Unweighted records are just alternating vertices, so one array holds them all.
+                vertices = array("q", chunk)
+                if sys.byteorder == "big":
+                    vertices.byteswap()
+                sources.extend(vertices[0::2])
+                targets.extend(vertices[1::2])
+            else:
+                for source, target, weight in struct.iter_unpack(record_format, chunk):
+                    sources.append(source)
+                    targets.append(target)
+                    weights.append(weight)
+
+    # array("q") and array("l") are the same size on 64-bit platforms other than Windows.
+    if sources.itemsize == array("l").itemsize:
+        sources, targets = array("l", sources.tobytes()), array("l", targets.tobytes())
+    else:
+        sources, targets = array("l", sources), array("l", targets)
+    return sources, targets, weights
+
+
+def write_binary_edges(path, sources, targets, weights=None):
+    """Write edges to path in the format read by read_binary_edges."""
+    record_format = "<qq" if weights is None else "<qqd"
+    columns = (sources, targets) if weights is None else (sources, targets, weights)
+    with open(path, "wb") as edge_file:
+        # Packing a few thousand records at a time keeps both memory use and write calls low.
+        records = zip(*columns)
+        while True:
+            block = [struct.pack(record_format, *record) for _, record in zip(range(4096), records)]
+            if not block:
+                break
+            edge_file.write(b"".join(block))
+
+
+# O(V + E) time.
+def load_graph(path, graph_class=Graph, num_vertices=None, binary=False, directed=True,
+               **read_kwargs):
+    """Load an edge list file into a new graph_class graph.
+
+    graph_class is Graph, DiGraph, DiGraphRecursive, EdgeWeightedGraph or CSRGraph (which is
+    directed unless directed=False). num_vertices defaults to one more than the largest vertex in
+    the file. The edges are parsed into arrays first, so the graph is created at its final size
+    and its adjacency lists are filled in one go rather than through add_edge. Other keyword
+    arguments are passed on to read_edges or read_binary_edges.
+    """
+    if issubclass(graph_class, EdgeWeightedGraph):
+        read_kwargs["weighted"] = True
+    read = read_binary_edges if binary else read_edges
+    sources, targets, weights = read(path, **read_kwargs)
+    if num_vertices is None:
+        num_vertices = max(max(sources, default=-1), max(targets, default=-1)) + 1
+
+    if issubclass(graph_class, CSRGraph):
+        return graph_class.from_arrays(num_vertices, sources, targets, directed, weights)
+
+    graph = graph_class(num_vertices)
+    if issubclass(graph_class, EdgeWeightedGraph):
+        for edge in map(Edge, sources, targets, weights):
+            graph.adj[edge.vertex].append(edge)
+            graph.adj[edge.other_vertex].append(edge)
+    else:
+        directed = issubclass(graph_class, (DiGraph, DiGraphRecursive))
+        if np is not None:
+            # Group the edges by vertex with NumPy as a CSR graph does, then slice each vertex's
+            # neighbours out.
+            packed = CSRGraph.from_arrays(num_vertices, sources, targets, directed)
+            offsets = packed.offsets
+            graph.adj[:] = [packed.targets[offsets[vertex] : offsets[vertex + 1]].tolist()
+                            for vertex in range(num_vertices)]
+        elif directed:
+            # Without NumPy, appending straight to the lists beats grouping the edges first.
+            for from_vertex, to_vertex in zip(sources, targets):
+                graph.adj[from_vertex].append(to_vertex)
+        else:
+            for from_vertex, to_vertex in zip(sources, targets):
+                graph.adj[from_vertex].append(to_vertex)
+                graph.adj[to_vertex].append(from_vertex)
+    graph.num_edges = len(sources)
+    return graph
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "edges.csv")
+        with open(path, "w") as edge_file:
+            edge_file.write("# from,to,weight\n0,1,1.3\n0,2,3.3\n1,4,9.2\n3,1,7.1\n2,3,10.1\n")
+
+        print(read_edges(path, delimiter=","))
+        print(load_graph(path, DiGraph, delimiter=","))
+        print(load_graph(path, Graph, delimiter=","))
+        print(load_graph(path, EdgeWeightedGraph, delimiter=",").edges())
+
+        binary_path = os.path.join(tmp_dir, "edges.bin")
+        write_binary_edges(binary_path, *read_edges(path, delimiter=","))
+        print(load_graph(binary_path, CSRGraph, binary=True))
@@ -0,0 +1,43 @@
+from python_dsa.trie.aho_corasick import AhoCorasick
+
+import random
+import unittest
+
+
+def _naive_matches(text, keywords):
+    return sorted((idx, key, val) for key, val in keywords.items()
+                  for idx in range(len(text)) if text.startswith(key, idx))
+
+
+class TestAhoCorasick(unittest.TestCase):
+
+    def test_finditer(self):
+        for _ in range(200):
+            keywords = {"".join(random.choices("abc", k=random.randint(1, 4))): random.randint(1, 9)
+                        for _ in range(random.randint(1, 8))}
+            text = "".join(random.choices("abc", k=random.randint(0, 50)))
+            automaton = AhoCorasick(keywords)
+            self.assertEqual(sorted(automaton.finditer(text)), _naive_matches(text, keywords))
+
+    def test_chunks(self):
+        keywords = {"abc": 1, "bcd": 2, "cd": 3, "d": 4, "abcdab": 5}
+        automaton = AhoCorasick(keywords)
+        text = b"xabcdabcdx" * 5
+        expected = _naive_matches(text, {key.encode(): val for key, val in keywords.items()})
+        for size in range(1, 12):
+            chunks = (text[idx : idx + size] for idx in range(0, len(text), size))
+            matches = [(idx, key.encode(), val)
+                       for idx, key, val in automaton.finditer_chunks(chunks)]
+            self.assertEqual(sorted(matches), expected)
+
+    def test_updates(self):
+        automaton = AhoCorasick({"he": 1, "she": 2})
+        self.assertEqual(list(automaton.finditer("she")), [(0, "she", 2), (1, "he", 1)])
+        automaton["hers"] = 3
+        del automaton["she"]
+        self.assertEqual(list(automaton.finditer("shers")), [(1, "he", 1), (1, "hers", 3)])
+        self.assertEqual(list(automaton.finditer("s€he")), [(2, "he", 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
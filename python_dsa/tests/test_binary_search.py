@@ -0,0 +1,183 @@
+from python_dsa.algorithms import benchmark
+from python_dsa.algorithms.binary_search import (LineFileSearch, RecordFileSearch,
+                                                 batch_binary_search, batch_bisect_left,
+                                                 exponential_search, interpolation_search)
+from python_dsa.algorithms.eytzinger import BTreeIndex, EytzingerIndex
+
+import bisect
+import os
+import random
+import struct
+import tempfile
+import unittest
+from array import array
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestBatchBinarySearch(unittest.TestCase):
+
+    def setUp(self):
+        self.seq = sorted(random.randint(0, 1000) for _ in range(500))
+        self.elems = [random.randint(-10, 1010) for _ in range(300)]
+
+    def test_bisect_left(self):
+        self.assertEqual(batch_bisect_left(self.seq, self.elems),
+                         [bisect.bisect_left(self.seq, elem) for elem in self.elems])
+
+    @unittest.skipUnless(np, "NumPy is not installed")
+    def test_numpy(self):
+        expected = [bisect.bisect_left(self.seq, elem) for elem in self.elems]
+        with mock.patch.object(np, "searchsorted", wraps=np.searchsorted) as searchsorted:
+            self.assertEqual(batch_bisect_left(self.seq, self.elems), expected)
+            self.assertEqual(batch_bisect_left(array("l", self.seq), array("l", self.elems)),
+                             expected)
+            self.assertEqual(batch_bisect_left(np.array(self.seq), np.array(self.elems)),
+                             expected)
+            self.assertEqual(batch_bisect_left(np.array(self.seq), np.array([])), [])
+        self.assertEqual(searchsorted.call_count, 3)
+        self.assertEqual(batch_binary_search(np.array([1, 3, 5]), np.array([2, 5])), [-1, 2])
+
+    def test_without_numpy(self):
+        expected = [bisect.bisect_left(self.seq, elem) for elem in self.elems]
+        # The algorithms package exports the binary_search function over its module's name.
+        with mock.patch.dict(batch_bisect_left.__globals__, np=None):
+            self.assertEqual(batch_bisect_left(self.seq, self.elems), expected)
+            self.assertEqual(batch_bisect_left(array("l", self.seq), array("l", self.elems)),
+                             expected)
+
+    def test_search(self):
+        for elem, idx in zip(self.elems, batch_binary_search(self.seq, self.elems)):
+            if elem in self.seq:
+                self.assertEqual(self.seq[idx], elem)
+            else:
+                self.assertEqual(idx, -1)
+
+    def test_strings(self):
+        seq = ["apple", "banana", "cherry"]
+        self.assertEqual(batch_binary_search(seq, ["cherry", "fig", "apple"]), [2, -1, 0])
+
+    def test_empty(self):
+        self.assertEqual(batch_binary_search([], [1, 2]), [-1, -1])
+        self.assertEqual(batch_binary_search([1, 2], []), [])
+
+
+class TestSearchVariants(unittest.TestCase):
+
+    def test_found_and_missing(self):
+        for seq in ([1, 4, 6, 10, 15, 53], [0.5, 1.5, 1.5, 2.25, 9.0], [7, 7, 7], [3], []):
+            for search in (exponential_search, interpolation_search):
+                for elem in set(seq) | {-1, 2, 100}:
+                    with self.subTest(search=search.__name__, seq=seq, elem=elem):
+                        idx = search(seq, elem)
+                        if elem in seq:
+                            self.assertEqual(seq[idx], elem)
+                        else:
+                            self.assertEqual(idx, -1)
+
+    def test_skewed(self):
+        seq = sorted(int(random.paretovariate(0.5)) for _ in range(2000))
+        for elem in random.sample(seq, 100):
+            self.assertEqual(seq[interpolation_search(seq, elem)], elem)
+
+    def test_benchmark(self):
+        results = benchmark.run_search(sizes=(500,), queries=50, repeats=2)
+        self.assertEqual(len(results), len(benchmark.SEARCHES) * len(benchmark.SEARCH_DISTRIBUTIONS))
+        self.assertTrue(all(result["probes"] > 0 for result in results))
+
+
+class TestStaticIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.keys = sorted(set(random.randint(0, 1000) for _ in range(300)))
+        self.indexes = (EytzingerIndex(self.keys), BTreeIndex(self.keys),
+                        BTreeIndex(self.keys, block_size=3))
+
+    def test_bounds(self):
+        for index in self.indexes:
+            for key in range(-5, 1006):
+                self.assertEqual(index.lower_bound(key), bisect.bisect_left(self.keys, key))
+                self.assertEqual(index.upper_bound(key), bisect.bisect_right(self.keys, key))
+
+    def test_contains(self):
+        for index in self.indexes:
+            for key in range(-5, 1006):
+                self.assertEqual(key in index, key in self.keys)
+
+    def test_iter(self):
+        for index in self.indexes:
+            self.assertEqual(list(index), self.keys)
+            self.assertEqual(len(index), len(self.keys))
+
+    def test_strings(self):
+        index = EytzingerIndex(["pear", "apple", "fig", "apple"])
+        self.assertEqual(list(index), ["apple", "fig", "pear"])
+        self.assertEqual(index.lower_bound("banana"), 1)
+
+    def test_empty(self):
+        for index in (EytzingerIndex([]), BTreeIndex([])):
+            self.assertEqual(index.lower_bound(1), 0)
+            self.assertNotIn(1, index)
+
+
+class TestFileSearch(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "sorted")
+        self.keys = sorted(random.randint(0, 500) for _ in range(300))
+
+    def test_records(self):
+        with open(self.path, "wb") as sorted_file:
+            for idx, key in enumerate(self.keys):
+                sorted_file.write(struct.pack(">qI", key, idx))
+
+        with RecordFileSearch(self.path, 12, key=lambda record: record[:8]) as searcher:
+            self.assertEqual(len(searcher), len(self.keys))
+            for key in range(502):
+                packed = struct.pack(">q", key)
+                offset = searcher.find(packed)
+                if key in self.keys:
+                    self.assertEqual(offset, self.keys.index(key) * 12)
+                else:
+                    self.assertEqual(offset, -1)
+
+                records = searcher.range(packed, struct.pack(">q", key + 20))
+                self.assertEqual([struct.unpack(">qI", record)[0] for _, record in records],
+                                 [elem for elem in self.keys if key <= elem < key + 20])
+
+    def test_lines(self):
+        lines = sorted(str(key).encode() for key in self.keys)
+        data = b"\n".join(lines)
+        for trailing_newline in (b"", b"\n"):
+            with open(self.path, "wb") as sorted_file:
+                sorted_file.write(data + trailing_newline)
+
+            with LineFileSearch(self.path) as searcher:
+                for line in lines + [b"", b"0", b"25", b"9999"]:
+                    offset = searcher.find(line)
+                    if line in lines:
+                        self.assertEqual(data[:offset].count(b"\n"), lines.index(line))
+                        self.assertEqual(searcher.line_at(offset), line)
+                    else:
+                        self.assertEqual(offset, -1)
+
+                    self.assertEqual([found for _, found in searcher.range(line, line + b"5")],
+                                     [elem for elem in lines if line <= elem < line + b"5"])
+
+    def test_empty(self):
+        open(self.path, "wb").close()
+        with RecordFileSearch(self.path, 8) as searcher:
+            self.assertEqual(searcher.find(b"a"), -1)
+        with LineFileSearch(self.path) as searcher:
+            self.assertEqual(searcher.find(b"a"), -1)
+            self.assertEqual(list(searcher.range(b"", b"z")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
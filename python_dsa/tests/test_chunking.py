@@ -0,0 +1,59 @@
+from python_dsa.algorithms.chunking import chunk_file, content_defined_chunks
+
+import hashlib
+import io
+import os
+import random
+import tempfile
+import unittest
+
+
+class TestContentDefinedChunks(unittest.TestCase):
+
+    def setUp(self):
+        self.data = random.Random(0).randbytes(100_000)
+
+    def test_chunks_cover_data(self):
+        chunks = list(content_defined_chunks(self.data, avg_size=1024))
+        offset = 0
+        for chunk_offset, length, digest in chunks:
+            self.assertEqual(chunk_offset, offset)
+            self.assertTrue(256 <= length <= 8192 or chunk_offset + length == len(self.data))
+            self.assertEqual(digest, hashlib.sha256(self.data[offset : offset + length]).digest())
+            offset += length
+        self.assertEqual(offset, len(self.data))
+        self.assertGreater(len(chunks), 20)
+
+    def test_sources_agree(self):
+        expected = list(content_defined_chunks(self.data, avg_size=1024))
+        for buffer_size in (1, 100, 4096):
+            self.assertEqual(list(content_defined_chunks(io.BytesIO(self.data), avg_size=1024,
+                                                         buffer_size=buffer_size)), expected)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "blob")
+            with open(path, "wb") as blob:
+                blob.write(self.data)
+            self.assertEqual(list(chunk_file(path, avg_size=1024)), expected)
+
+            open(path, "wb").close()
+            self.assertEqual(list(chunk_file(path)), [])
+
+    def test_insertion_only_changes_nearby_chunks(self):
+        edited = self.data[:50_000] + b"inserted" + self.data[50_000:]
+        seen = {digest for _, _, digest in content_defined_chunks(self.data, avg_size=1024)}
+        new_bytes = sum(length for _, length, digest in
+                        content_defined_chunks(edited, avg_size=1024) if digest not in seen)
+        self.assertLess(new_bytes, 10 * 1024)
+
+    def test_sizes(self):
+        with self.assertRaises(ValueError):
+            next(content_defined_chunks(self.data, avg_size=1024, min_size=2048))
+        lengths = [length for _, length, _ in
+                   content_defined_chunks(self.data, avg_size=1024, min_size=512, max_size=1536)]
+        self.assertTrue(all(512 <= length <= 1536 for length in lengths[:-1]))
+        self.assertIn(1536, lengths)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,364 @@
+from python_dsa.algorithms.breadth_first_paths import (BreadthFirstPaths, all_sources_distances,
+                                                       reachability)
+from python_dsa.graph import csr_graph, loaders
+from python_dsa.graph.csr_graph import CSRGraph, save_graph
+from python_dsa.graph.directed_graph import DiGraph
+from python_dsa.graph.directed_graph_recursive import DiGraphRecursive
+from python_dsa.graph.edge_graph import Edge, EdgeWeightedGraph
+from python_dsa.graph.loaders import load_graph, read_binary_edges, read_edges, write_binary_edges
+from python_dsa.graph.undirected_graph import Graph
+
+import os
+import pickle
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _random_edges(num_vertices, num_edges):
+    return [(random.randrange(num_vertices), random.randrange(num_vertices))
+            for _ in range(num_edges)]
+
+
+class TestCSRGraph(unittest.TestCase):
+
+    def test_matches_adjacency_lists(self):
+        for _ in range(50):
+            num_vertices = random.randint(1, 30)
+            edges = _random_edges(num_vertices, random.randint(0, 60))
+            for graph, csr_graph in ((DiGraph(num_vertices, edges),
+                                      CSRGraph.from_edges(num_vertices, edges)),
+                                     (Graph(num_vertices, edges),
+                                      CSRGraph.from_edges(num_vertices, edges, directed=False))):
+                self.assertEqual(str(csr_graph), str(graph))
+                self.assertEqual(csr_graph.num_vertices, graph.num_vertices)
+                self.assertEqual(csr_graph.num_edges, graph.num_edges)
+                source = random.randrange(num_vertices)
+                self.assertEqual(list(csr_graph.bfs(source)), list(graph.bfs(source)))
+                self.assertEqual(list(csr_graph.dfs(source)), list(graph.dfs(source)))
+                self.assertEqual(list(csr_graph.edges(source)), list(graph.edges(source)))
+
+            self.assertEqual(str(CSRGraph.from_edges(num_vertices, edges).reverse()),
+                             str(DiGraph(num_vertices, edges).reverse()))
+            undirected = CSRGraph.from_edges(num_vertices, edges, directed=False)
+            self.assertEqual(str(undirected.reverse()), str(undirected))
+            self.assertEqual(undirected.reverse().num_edges, len(edges))
+            self.assertEqual(str(CSRGraph.from_adjacency(Graph(num_vertices, edges).adj, False)),
+                             str(Graph(num_vertices, edges)))
+
+    def test_reverse_weighted(self):
+        graph = CSRGraph.from_edges(3, ((0, 1), (1, 2)), directed=False)
+        self.assertEqual([list(graph.reverse().adj[vertex]) for vertex in range(3)],
+                         [[1], [0, 2], [1]])
+        weighted = CSRGraph.from_arrays(3, [0, 1], [1, 2], weights=[0.5, 1.5])
+        reverse = weighted.reverse()
+        self.assertEqual(list(reverse.edges(2)), [1])
+        self.assertEqual(list(reverse.edge_weights(2)), [1.5])
+        self.assertEqual(reverse.num_edges, 2)
+
+    def _check_from_arrays(self):
+        num_vertices = 30
+        edges = [(v, w, random.random()) for v, w in _random_edges(num_vertices, 200)]
+        sources, targets, weights = zip(*edges)
+        for directed in (True, False):
+            expected = [[] for _ in range(num_vertices)]
+            for v, w, weight in edges:
+                expected[v].append((w, weight))
+                if not directed:
+                    expected[w].append((v, weight))
+            graph = CSRGraph.from_arrays(num_vertices, sources, targets, directed, weights)
+            self.assertEqual([list(zip(graph.edges(vertex), graph.edge_weights(vertex)))
+                              for vertex in range(num_vertices)], expected)
+
+    @unittest.skipUnless(np, "NumPy is not installed")
+    def test_from_arrays_numpy(self):
+        with mock.patch.object(np, "argsort", wraps=np.argsort) as argsort:
+            self._check_from_arrays()
+        self.assertEqual(argsort.call_count, 2)
+
+    def test_from_arrays_without_numpy(self):
+        with mock.patch.object(csr_graph, "np", None):
+            self._check_from_arrays()
+
+    def test_storage(self):
+        graph = CSRGraph.from_edges(4, ((0, 1), (0, 2), (2, 3)))
+        self.assertEqual(graph.offsets.typecode, "l")
+        self.assertEqual(list(graph.offsets), [0, 2, 2, 3, 3])
+        self.assertEqual(list(graph.targets), [1, 2, 3])
+        self.assertEqual(graph.degree(0), 2)
+
+    def test_out_of_range(self):
+        with self.assertRaises(IndexError):
+            CSRGraph.from_edges(2, ((0, 2),))
+        with self.assertRaises(IndexError):
+            CSRGraph.from_edges(2, ((-1, 0),))
+
+
+def _reference_distances(graph, source):
+    """Distances from source by a plain BFS over graph.bfs's adjacency lists."""
+    distances = [-1] * graph.num_vertices
+    distances[source] = 0
+    for vertex in graph.bfs(source):
+        for adjacent_vertex in graph.adj[vertex]:
+            if distances[adjacent_vertex] == -1:
+                distances[adjacent_vertex] = distances[vertex] + 1
+    return distances
+
+
+class TestBreadthFirstPaths(unittest.TestCase):
+
+    def _check(self, graph, paths, source):
+        self.assertEqual(list(paths.distances), _reference_distances(graph, source))
+        for vertex in range(graph.num_vertices):
+            path = paths.path_to(vertex)
+            if paths.has_path_to(vertex):
+                self.assertEqual(len(path) - 1, paths.distance_to(vertex))
+                self.assertEqual(path[0], source)
+                for from_vertex, to_vertex in zip(path, path[1:]):
+                    self.assertIn(to_vertex, list(graph.adj[from_vertex]))
+            else:
+                self.assertIsNone(path)
+
+    def test_directions(self):
+        for _ in range(30):
+            num_vertices = random.randint(1, 60)
+            edges = _random_edges(num_vertices, random.randint(0, 4 * num_vertices))
+            source = random.randrange(num_vertices)
+            for graph in (Graph(num_vertices, edges),
+                          CSRGraph.from_edges(num_vertices, edges, directed=False)):
+                # alpha=0 never goes bottom up, and a huge alpha always does.
+                for alpha in (0, 14, 10**9):
+                    self._check(graph, BreadthFirstPaths(graph, source, alpha=alpha), source)
+
+            graph = DiGraph(num_vertices, edges)
+            for alpha in (0, 14, 10**9):
+                self._check(graph, BreadthFirstPaths(graph, source, graph.reverse(), alpha=alpha),
+                            source)
+            self._check(graph, BreadthFirstPaths(graph, source), source)
+            graph = DiGraphRecursive(num_vertices, edges)
+            self.assertEqual(list(BreadthFirstPaths(graph, source).distances),
+                             _reference_distances(DiGraph(num_vertices, edges), source))
+
+    def test_multi_source(self):
+        for _ in range(30):
+            num_vertices = random.randint(1, 60)
+            edges = _random_edges(num_vertices, random.randint(0, 2 * num_vertices))
+            sources = random.sample(range(num_vertices), random.randint(1, min(5, num_vertices)))
+            for graph in (Graph(num_vertices, edges), DiGraph(num_vertices, edges)):
+                columns = [_reference_distances(graph, source) for source in sources]
+                expected = [min((distance for distance in column if distance != -1), default=-1)
+                            for column in zip(*columns)]
+                paths = BreadthFirstPaths(graph, sources + sources[:1])
+                self.assertEqual(list(paths.distances), expected)
+                for vertex in range(num_vertices):
+                    if paths.has_path_to(vertex):
+                        self.assertIn(paths.path_to(vertex)[0], sources)
+
+    def test_all_sources(self):
+        num_vertices = 80
+        edges = _random_edges(num_vertices, 120)
+        sources = [random.randrange(num_vertices) for _ in range(40)]
+        for graph in (DiGraph(num_vertices, edges),
+                      CSRGraph.from_edges(num_vertices, edges, directed=False)):
+            expected = [_reference_distances(graph, source) for source in sources]
+            for batch_size in (1, 7, 64):
+                self.assertEqual([list(distances) for distances in
+                                  all_sources_distances(graph, sources, batch_size)], expected)
+
+            masks = reachability(graph, sources)
+            for vertex in range(num_vertices):
+                self.assertEqual([bool(masks[vertex] >> idx & 1) for idx in range(len(sources))],
+                                 [column[vertex] != -1 for column in expected])
+
+    def test_all_sources_workers(self):
+        edges = _random_edges(50, 100)
+        sources = list(range(0, 50, 3))
+        expected = [_reference_distances(DiGraph(50, edges), source) for source in sources]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "graph.csr")
+            CSRGraph.from_edges(50, edges).save(path)
+            distances = all_sources_distances(CSRGraph.load(path), sources, batch_size=4,
+                                              workers=2)
+        self.assertEqual([list(column) for column in distances], expected)
+
+
+class TestGraphFile(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "graph.csr")
+        self.edges = _random_edges(30, 100)
+
+    def test_round_trip(self):
+        for graph in (Graph(30, self.edges), DiGraph(30, self.edges),
+                      DiGraphRecursive(30, self.edges)):
+            save_graph(graph, self.path)
+            loaded = CSRGraph.load(self.path)
+            self.assertIsInstance(loaded.targets, memoryview)
+            self.assertEqual(str(loaded), str(graph))
+            self.assertEqual(loaded.num_edges, graph.num_edges)
+            self.assertEqual(loaded.directed, not isinstance(graph, Graph) or
+                             isinstance(graph, DiGraph))
+            self.assertIsNone(loaded.weights)
+            self.assertEqual(list(loaded.bfs(0)), list(CSRGraph.from_graph(graph).bfs(0)))
+
+    def test_weighted(self):
+        graph = EdgeWeightedGraph(30)
+        for vertex, other_vertex in self.edges:
+            graph.add_edge(Edge(vertex, other_vertex, random.random()))
+        save_graph(graph, self.path)
+        loaded = CSRGraph.load(self.path)
+        self.assertEqual(loaded.num_edges, graph.num_edges)
+        for vertex in range(30):
+            self.assertEqual(list(zip(loaded.adj[vertex], loaded.edge_weights(vertex))),
+                             [(edge.other(vertex), edge.weight) for edge in graph.adj[vertex]])
+
+    def test_pickle(self):
+        CSRGraph.from_edges(30, self.edges).save(self.path)
+        loaded = pickle.loads(pickle.dumps(CSRGraph.load(self.path)))
+        self.assertEqual(loaded.path, self.path)
+        self.assertEqual(str(loaded), str(DiGraph(30, self.edges)))
+
+        in_memory = CSRGraph.from_edges(30, self.edges, directed=False)
+        self.assertEqual(str(pickle.loads(pickle.dumps(in_memory))), str(in_memory))
+
+    def test_close(self):
+        save_graph(EdgeWeightedGraph(30), self.path)
+        with CSRGraph.load(self.path) as loaded:
+            self.assertEqual(list(loaded.bfs(0)), [0])
+            self.assertEqual(list(loaded.edge_weights(0)), [])
+        # Nothing holds the file open, so it can be removed or replaced.
+        os.remove(self.path)
+        loaded.close()
+
+        CSRGraph.from_edges(30, self.edges).save(self.path)
+        loaded = CSRGraph.load(self.path)
+        neighbours = loaded.adj[0]
+        with self.assertRaises(BufferError):
+            loaded.close()
+        neighbours.release()
+        loaded.close()
+        os.replace(self.path, self.path + ".old")
+
+    def test_invalid(self):
+        CSRGraph.from_edges(30, self.edges).save(self.path)
+        with open(self.path, "r+b") as graph_file:
+            graph_file.truncate(100)
+        with self.assertRaises(ValueError):
+            CSRGraph.load(self.path)
+        with open(self.path, "wb") as graph_file:
+            graph_file.write(b"not a graph" * 10)
+        with self.assertRaises(ValueError):
+            CSRGraph.load(self.path)
+
+
+class TestLoaders(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = tmp_dir.name
+        self.edges = _random_edges(20, 200)
+        self.weights = [round(random.uniform(0, 10), 2) for _ in self.edges]
+
+    def _write_text(self, name, lines):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, "w") as edge_file:
+            edge_file.write("\n".join(lines))
+        return path
+
+    def test_read_edges(self):
+        sources, targets = (list(vertices) for vertices in zip(*self.edges))
+        paths = (
+            (self._write_text("edges.txt", (f"{v} \t{w}" for v, w in self.edges)), None),
+            (self._write_text("edges.csv", ["# from,to,weight"] + [
+                f"{v},{w},{weight}" for (v, w), weight in zip(self.edges, self.weights)]), ","),
+        )
+        for path, delimiter in paths:
+            for chunk_size in (7, 100, 1 << 20):
+                read = read_edges(path, delimiter=delimiter, chunk_size=chunk_size)
+                self.assertEqual((list(read[0]), list(read[1]), read[2]), (sources, targets, None))
+
+        read = read_edges(paths[1][0], delimiter=",", weighted=True, chunk_size=50)
+        self.assertEqual(list(read[2]), self.weights)
+        with self.assertRaises(ValueError):
+            read_edges(paths[0][0], weighted=True)
+
+    def test_read_edges_invalid(self):
+        lines = [f"{v} {w}" for v, w in self.edges]
+        header = self._write_text("header.csv", ["from,to"] + lines)
+        with self.assertRaisesRegex(ValueError, "line 1 of .*header.csv"):
+            read_edges(header, delimiter=",")
+
+        # The bad lines are found in later chunks too.
+        for bad_line in ("3 4 5", "3", "3 x"):
+            path = self._write_text("edges.txt", ["# comment"] + lines[:150] + [bad_line]
+                                    + lines[150:])
+            for chunk_size in (10, 1 << 20):
+                with self.subTest(bad_line=bad_line, chunk_size=chunk_size), \
+                        self.assertRaisesRegex(ValueError, "line 152 of"):
+                    read_edges(path, chunk_size=chunk_size)
+
+    def test_binary_edges(self):
+        sources, targets = (list(vertices) for vertices in zip(*self.edges))
+        path = os.path.join(self.tmp_dir, "edges.bin")
+        write_binary_edges(path, sources, targets)
+        # Chunks smaller than a record still read one record at a time.
+        for chunk_size in (1, 100, 1 << 20):
+            read = read_binary_edges(path, chunk_size=chunk_size)
+            self.assertEqual((list(read[0]), list(read[1]), read[2]), (sources, targets, None))
+
+        write_binary_edges(path, sources, targets, self.weights)
+        for chunk_size in (1, 100):
+            self.assertEqual(list(read_binary_edges(path, weighted=True, chunk_size=chunk_size)[2]),
+                             self.weights)
+
+    def _check_numpy_branches(self):
+        sources, targets = (list(vertices) for vertices in zip(*self.edges))
+        path = os.path.join(self.tmp_dir, "edges.bin")
+        write_binary_edges(path, sources, targets, self.weights)
+        read = read_binary_edges(path, weighted=True, chunk_size=100)
+        self.assertEqual((list(read[0]), list(read[1]), list(read[2])),
+                         (sources, targets, self.weights))
+
+        write_binary_edges(path, sources, targets)
+        for graph_class in (Graph, DiGraph):
+            graph = load_graph(path, graph_class, binary=True)
+            self.assertEqual(str(graph), str(graph_class(20, self.edges)))
+
+    @unittest.skipUnless(np, "NumPy is not installed")
+    def test_numpy(self):
+        with mock.patch.object(np, "frombuffer", wraps=np.frombuffer) as frombuffer:
+            self._check_numpy_branches()
+        frombuffer.assert_called()
+
+    def test_without_numpy(self):
+        with mock.patch.object(loaders, "np", None), mock.patch.object(csr_graph, "np", None):
+            self._check_numpy_branches()
+
+    def test_load_graph(self):
+        path = self._write_text("edges.txt", (f"{v} {w} {weight}"
+                                              for (v, w), weight in zip(self.edges, self.weights)))
+        for graph_class in (Graph, DiGraph, DiGraphRecursive):
+            graph = load_graph(path, graph_class)
+            expected = graph_class(20, self.edges)
+            self.assertEqual(str(graph), str(expected))
+            self.assertEqual(graph.num_edges, expected.num_edges)
+
+        graph = load_graph(path, EdgeWeightedGraph, num_vertices=25)
+        self.assertEqual(graph.num_vertices, 25)
+        self.assertEqual([(edge.vertex, edge.other_vertex, edge.weight) for edge in graph.adj[3]],
+                         [(v, w, weight) for (v, w), weight in zip(self.edges, self.weights)
+                          if 3 in (v, w) for _ in range(1 + (v == w))])
+        self.assertEqual(str(load_graph(path, CSRGraph, directed=False)), str(Graph(20, self.edges)))
+
+
+if __name__ == "__main__":
+    unittest.main()
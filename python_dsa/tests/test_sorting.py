@@ -1,6 +1,28 @@
-from python_dsa.sorting import quick_sort
+from python_dsa.algorithms import benchmark, sorting
+from python_dsa.algorithms.cutoff_calibration import calibrate_cutoffs
+from python_dsa.algorithms.external_sort import external_sort, external_sort_file
+from python_dsa.algorithms.instrumentation import SortStats, instrumented
+from python_dsa.algorithms.radix_sort import (key_indexed_counting, lsd_int_sort, lsd_sort, msd_sort,
+                                              three_way_string_quick_sort)
+from python_dsa.algorithms.sorting import (_heap_sort_range, bottom_up_merge_sort, heap_sort,
+                                           heapq_sort, hybrid_sort, insertion_sort, merge_sort,
+                                           nth_element, parallel_sort, partial_sort, quick_sort,
+                                           quickselect, selection_sort, shell_sort,
+                                           three_way_quick_sort, top_k)
+
+import json
+import os
+import random
+import tempfile
+from array import array
 
 import unittest
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestQuickSort(unittest.TestCase):
@@ -23,6 +45,438 @@ class TestQuickSort(unittest.TestCase):
         self.assertEqual(quick_sort([4, 1, 2, 5, 6, 7], cutoff=6), [1, 2, 4, 5, 6, 7])
 
 
+class TestSelection(unittest.TestCase):
+
+    def setUp(self):
+        self.arr = [random.randint(0, 100) for _ in range(501)]
+
+    def test_quickselect(self):
+        for k in (0, 1, 250, 499, 500):
+            with self.subTest(k=k):
+                self.assertEqual(quickselect(self.arr.copy(), k), sorted(self.arr)[k])
+
+    def test_nth_element(self):
+        arr = nth_element(self.arr.copy(), 100)
+        self.assertTrue(all(elem <= arr[100] for elem in arr[:100]))
+        self.assertTrue(all(elem >= arr[100] for elem in arr[101:]))
+
+    def test_nth_element_out_of_range(self):
+        with self.assertRaises(IndexError):
+            nth_element([1, 2, 3], 3)
+
+    def test_partial_sort(self):
+        self.assertEqual(partial_sort(self.arr.copy(), 20)[:20], sorted(self.arr)[:20])
+        self.assertEqual(partial_sort(self.arr.copy(), 1000), sorted(self.arr))
+
+    def test_top_k(self):
+        self.assertEqual(top_k(iter(self.arr), 5), sorted(self.arr, reverse=True)[:5])
+        self.assertEqual(top_k(iter(self.arr), 5, largest=False), sorted(self.arr)[:5])
+        self.assertEqual(top_k(self.arr, 5, key=lambda elem: -elem), sorted(self.arr)[:5])
+
+
+class TestBottomUpMergeSort(unittest.TestCase):
+
+    def test_small(self):
+        self.assertEqual(bottom_up_merge_sort([4, 1, 2, 5, 6, 7]), [1, 2, 4, 5, 6, 7])
+
+    def test_empty(self):
+        self.assertEqual(bottom_up_merge_sort([]), [])
+
+    def test_one_elem(self):
+        self.assertEqual(bottom_up_merge_sort([1]), [1])
+
+    def test_random(self):
+        arr = [random.randint(0, 10**6) for _ in range(1001)]
+        self.assertEqual(bottom_up_merge_sort(arr.copy()), sorted(arr))
+
+    def test_cutoff(self):
+        arr = [random.randint(0, 100) for _ in range(1001)]
+        self.assertEqual(bottom_up_merge_sort(arr.copy(), cutoff=7), sorted(arr))
+
+    def test_stable(self):
+        arr = [(random.randint(0, 5), idx) for idx in range(500)]
+        keys = [_StableKey(elem) for elem in arr]
+        self.assertEqual([key.elem for key in bottom_up_merge_sort(keys)],
+                         sorted(arr, key=lambda elem: elem[0]))
+
+
+class _StableKey:
+    """Compares on the first item only so that stability can be checked."""
+
+    def __init__(self, elem):
+        self.elem = elem
+
+    def __lt__(self, other):
+        return self.elem[0] < other.elem[0]
+
+
+class TestBackend(unittest.TestCase):
+
+    def test_numeric_list(self):
+        arr = [random.randint(-10**6, 10**6) for _ in range(500)]
+        for sort in (merge_sort, quick_sort):
+            with self.subTest(sort=sort.__name__):
+                result = sort(arr.copy())
+                self.assertEqual(result, sorted(arr))
+                self.assertTrue(all(type(elem) is int for elem in result))
+
+    def test_array(self):
+        arr = array("d", (random.random() for _ in range(500)))
+        for sort in (merge_sort, quick_sort):
+            with self.subTest(sort=sort.__name__):
+                self.assertEqual(sort(array("d", arr)), array("d", sorted(arr)))
+
+    def test_python_backend(self):
+        arr = [random.random() for _ in range(500)]
+        self.assertEqual(merge_sort(arr.copy(), cutoff=5, backend="python"), sorted(arr))
+        self.assertEqual(quick_sort(arr.copy(), backend="python", reverse=True),
+                         sorted(arr, reverse=True))
+
+    @unittest.skipUnless(np, "NumPy is not installed")
+    def test_numpy_backend(self):
+        arr = [random.randint(-10**6, 10**6) for _ in range(500)]
+        for sort in (merge_sort, quick_sort):
+            with self.subTest(sort=sort.__name__), \
+                    mock.patch.object(np, "array", wraps=np.array) as np_array:
+                self.assertEqual(sort(arr.copy()), sorted(arr))
+                np_array.assert_called_once()
+                self.assertEqual(sort(array("l", arr)), array("l", sorted(arr)))
+
+    def test_without_numpy(self):
+        arr = [random.randint(-10**6, 10**6) for _ in range(500)]
+        with mock.patch.object(sorting, "np", None):
+            for sort in (merge_sort, quick_sort):
+                with self.subTest(sort=sort.__name__):
+                    self.assertEqual(sort(arr.copy()), sorted(arr))
+                    self.assertEqual(sort(array("l", arr)), array("l", sorted(arr)))
+
+
+class TestHybridSort(unittest.TestCase):
+
+    def test_small(self):
+        self.assertEqual(hybrid_sort([4, 1, 2, 5, 6, 7]), [1, 2, 4, 5, 6, 7])
+
+    def test_empty(self):
+        self.assertEqual(hybrid_sort([]), [])
+
+    def test_one_elem(self):
+        self.assertEqual(hybrid_sort([1]), [1])
+
+    def test_random(self):
+        arr = [random.randint(0, 10**6) for _ in range(2000)]
+        self.assertEqual(hybrid_sort(arr.copy()), sorted(arr))
+
+    def test_few_unique(self):
+        arr = [random.randint(0, 3) for _ in range(2000)]
+        self.assertEqual(hybrid_sort(arr.copy()), sorted(arr))
+
+    def test_runs(self):
+        arr = list(range(500)) + list(range(1000, 500, -1)) + list(range(250))
+        self.assertEqual(hybrid_sort(arr.copy()), sorted(arr))
+
+    def test_reversed(self):
+        self.assertEqual(hybrid_sort(list(range(1000, 0, -1))), list(range(1, 1001)))
+
+    def test_heap_sort_range(self):
+        arr = [random.randint(0, 100) for _ in range(300)]
+        for lo, hi in ((0, 299), (0, 0), (10, 11), (57, 242)):
+            with self.subTest(lo=lo, hi=hi):
+                result = arr.copy()
+                _heap_sort_range(result, lo, hi)
+                self.assertEqual(result, arr[:lo] + sorted(arr[lo : hi + 1]) + arr[hi + 1 :])
+
+    def test_heap_sort_fallback(self):
+        # Without the median of three the pivot is the first element, and so the smallest in
+        # nearly sorted input, so every partition is as unbalanced as it can be.
+        arr = list(range(2000))
+        arr[-2], arr[-1] = arr[-1], arr[-2]
+        with mock.patch.object(sorting, "_median_of_three"), \
+                mock.patch.object(sorting, "_heap_sort_range",
+                                  wraps=sorting._heap_sort_range) as heap_sort_range:
+            self.assertEqual(hybrid_sort(arr.copy(), min_run=len(arr) + 1), sorted(arr))
+        self.assertTrue(heap_sort_range.called)
+
+
+class TestKey(unittest.TestCase):
+
+    sorts = (selection_sort, insertion_sort, shell_sort, merge_sort, bottom_up_merge_sort, quick_sort,
+             three_way_quick_sort, heap_sort, heapq_sort, hybrid_sort)
+
+    def setUp(self):
+        self.records = [{"id": idx, "score": random.randint(0, 20)} for idx in range(200)]
+
+    def test_key(self):
+        expected = sorted(self.records, key=lambda record: record["score"])
+        for sort in self.sorts:
+            with self.subTest(sort=sort.__name__):
+                self.assertEqual(sort(self.records.copy(), key=lambda record: record["score"]),
+                                 expected)
+
+    def test_reverse(self):
+        expected = sorted(self.records, key=lambda record: record["score"], reverse=True)
+        for sort in self.sorts:
+            with self.subTest(sort=sort.__name__):
+                self.assertEqual(sort(self.records.copy(), key=lambda record: record["score"],
+                                      reverse=True), expected)
+
+    def test_reverse_without_key(self):
+        arr = [random.randint(0, 50) for _ in range(200)]
+        for sort in self.sorts:
+            with self.subTest(sort=sort.__name__):
+                self.assertEqual(sort(arr.copy(), reverse=True), sorted(arr, reverse=True))
+
+    def test_key_called_once_per_elem(self):
+        calls = []
+
+        def key(record):
+            calls.append(record)
+            return record["score"]
+
+        merge_sort(self.records.copy(), key=key)
+        self.assertEqual(len(calls), len(self.records))
+
+    def test_cutoff_with_key(self):
+        self.assertEqual(quick_sort([4, 1, 2, 5, 6, 7], cutoff=6, key=lambda elem: -elem),
+                         [7, 6, 5, 4, 2, 1])
+
+
+class TestExternalSort(unittest.TestCase):
+
+    def test_single_chunk(self):
+        arr = [random.randint(0, 100) for _ in range(50)]
+        self.assertEqual(list(external_sort(arr, chunk_size=100)), sorted(arr))
+
+    def test_many_runs(self):
+        arr = [random.randint(0, 10**6) for _ in range(5000)]
+        self.assertEqual(list(external_sort(arr, chunk_size=100, max_open_runs=4)), sorted(arr))
+
+    def test_run_files_are_closed(self):
+        arr = [random.randint(0, 10**6) for _ in range(10_000)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            opened = []
+            real_open = open
+
+            def counting_open(*args, **kwargs):
+                run = real_open(*args, **kwargs)
+                opened.append(run)
+                # The runs being merged and the run they are merged into.
+                self.assertLessEqual(sum(not run.closed for run in opened), 8 + 1)
+                return run
+
+            with mock.patch("builtins.open", counting_open):
+                result = list(external_sort(arr, chunk_size=100, max_open_runs=8, tmp_dir=tmp_dir))
+            self.assertEqual(result, sorted(arr))
+            # 100 runs are merged in groups of 8 into 13, those into 2 and those into the result,
+            # so each of the 115 run files is opened once to write and once to read.
+            self.assertEqual(len(opened), 2 * (100 + 13 + 2))
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+    def test_sort_returning_new_list(self):
+        arr = [3, 1, 2] * 50
+        self.assertEqual(list(external_sort(arr, chunk_size=40, sort=heapq_sort)), sorted(arr))
+        self.assertEqual(list(external_sort(arr, chunk_size=200, sort=heapq_sort)), sorted(arr))
+
+    def test_key_is_stable(self):
+        records = [(random.randint(0, 5), idx) for idx in range(2000)]
+        self.assertEqual(list(external_sort(records, chunk_size=64, max_open_runs=3,
+                                            key=lambda record: record[0], reverse=True)),
+                         sorted(records, key=lambda record: record[0], reverse=True))
+
+    def test_empty(self):
+        self.assertEqual(list(external_sort([], chunk_size=10)), [])
+
+    def test_file(self):
+        lines = [f"{random.randint(0, 10**6)}\n" for _ in range(1000)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = os.path.join(tmp_dir, "input.txt")
+            output_path = os.path.join(tmp_dir, "output.txt")
+            with open(input_path, "w") as input_file:
+                input_file.write("".join(lines).rstrip("\n"))
+
+            external_sort_file(input_path, output_path, chunk_size=100)
+            with open(output_path) as output_file:
+                self.assertEqual(output_file.readlines(), sorted(lines))
+
+
+class TestParallelSort(unittest.TestCase):
+
+    def test_ints(self):
+        arr = [random.randint(-10**12, 10**12) for _ in range(5000)]
+        self.assertEqual(parallel_sort(arr.copy(), workers=3, min_chunk_size=100), sorted(arr))
+
+    def test_floats(self):
+        arr = [random.random() for _ in range(5000)]
+        self.assertEqual(parallel_sort(arr.copy(), sort=three_way_quick_sort, workers=2,
+                                       min_chunk_size=100), sorted(arr))
+
+    def test_array(self):
+        arr = array("l", (random.randint(0, 1000) for _ in range(5000)))
+        self.assertEqual(parallel_sort(arr, workers=4, min_chunk_size=100),
+                         array("l", sorted(arr)))
+
+    def test_objects(self):
+        arr = [str(random.randint(0, 10**6)) for _ in range(5000)]
+        self.assertEqual(parallel_sort(arr.copy(), workers=2, min_chunk_size=100), sorted(arr))
+
+    def test_key(self):
+        arr = [random.randint(0, 10**6) for _ in range(5000)]
+        self.assertEqual(parallel_sort(arr.copy(), workers=2, min_chunk_size=100, reverse=True,
+                                       key=lambda elem: elem % 1000),
+                         sorted(arr, key=lambda elem: elem % 1000, reverse=True))
+
+    def test_small(self):
+        self.assertEqual(parallel_sort([4, 1, 2, 5, 6, 7]), [1, 2, 4, 5, 6, 7])
+
+
+class TestRadixSort(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ["".join(random.choice("abcd") for _ in range(random.randint(0, 6)))
+                      for _ in range(500)]
+
+    def test_key_indexed_counting(self):
+        arr = [random.randint(0, 9) for _ in range(500)]
+        self.assertEqual(key_indexed_counting(arr.copy(), radix=10), sorted(arr))
+
+    def test_lsd_sort(self):
+        hex_ids = [f"{random.getrandbits(64):016x}" for _ in range(500)]
+        self.assertEqual(lsd_sort(hex_ids.copy()), sorted(hex_ids))
+        hex_bytes = [hex_id.encode() for hex_id in hex_ids]
+        self.assertEqual(lsd_sort(hex_bytes.copy()), sorted(hex_bytes))
+
+    def test_lsd_sort_radix(self):
+        self.assertEqual(lsd_sort(["€a", "ab"], radix=0x10000), ["ab", "€a"])
+        with self.assertRaisesRegex(ValueError, "radix 256"):
+            lsd_sort(["€a", "ab"])
+        with self.assertRaisesRegex(ValueError, "radix 128"):
+            lsd_sort([b"\xffa", b"ab"], radix=128)
+
+    def test_lsd_int_sort(self):
+        arr = [random.randint(-2**63, 2**63 - 1) for _ in range(500)]
+        self.assertEqual(lsd_int_sort(arr.copy()), sorted(arr))
+        self.assertEqual(lsd_int_sort([5, 5, 5]), [5, 5, 5])
+        self.assertEqual(lsd_int_sort([]), [])
+
+    def test_msd_sort(self):
+        self.assertEqual(msd_sort(self.words.copy()), sorted(self.words))
+        self.assertEqual(msd_sort(self.words.copy(), cutoff=0), sorted(self.words))
+
+    def test_three_way_string_quick_sort(self):
+        self.assertEqual(three_way_string_quick_sort(self.words.copy()), sorted(self.words))
+        self.assertEqual(three_way_string_quick_sort(self.words.copy(), cutoff=0),
+                         sorted(self.words))
+
+    def test_three_way_string_quick_sort_in_place(self):
+        class _NoSlices(list):
+            def __getitem__(self, idx):
+                if isinstance(idx, slice):
+                    raise AssertionError("Sorted by slicing")
+                return super().__getitem__(idx)
+
+        words = _NoSlices(self.words)
+        self.assertEqual(three_way_string_quick_sort(words, cutoff=15), sorted(self.words))
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_sorts_in_place(self):
+        arr = [random.randint(0, 1000) for _ in range(300)]
+        result = arr.copy()
+        self.assertIs(instrumented(merge_sort)(result, cutoff=5), result)
+        self.assertEqual(result, sorted(arr))
+
+    def test_counts(self):
+        counted_selection_sort = instrumented(selection_sort)
+        counted_selection_sort([4, 3, 2, 1])
+        # n(n - 1)/2 comparisons and one swap (two moves) per index.
+        self.assertEqual(counted_selection_sort.stats.compares, 6)
+        self.assertEqual(counted_selection_sort.stats.moves, 8)
+
+    def test_aux_buffer_moves(self):
+        counted_bottom_up_merge_sort = instrumented(bottom_up_merge_sort)
+        counted_bottom_up_merge_sort(random.sample(range(1024), 1024))
+        # Every one of the log2(1024) passes writes all 1024 elements, alternately into the
+        # sequence and into its copy.
+        self.assertEqual(counted_bottom_up_merge_sort.stats.moves, 10 * 1024)
+
+    def test_aux_copy_moves(self):
+        counted_merge_sort = instrumented(merge_sort)
+        counted_merge_sort(random.sample(range(1024), 1024), cutoff=0)
+        # Each of the log2(1024) levels copies all 1024 elements into aux and merges them back.
+        self.assertEqual(counted_merge_sort.stats.moves, 2 * 10 * 1024)
+
+    def test_key_counts_pairs(self):
+        arr = random.sample(range(300), 300)
+        for sort in (merge_sort, bottom_up_merge_sort, hybrid_sort, selection_sort):
+            with self.subTest(sort=sort.__name__):
+                counted_sort = instrumented(sort)
+                counted_sort(arr.copy())
+                stats = counted_sort.stats
+                self.assertEqual(counted_sort(arr.copy(), key=lambda elem: elem % 300),
+                                 sorted(arr))
+                self.assertEqual(counted_sort.stats.compares, stats.compares)
+                self.assertEqual(counted_sort.stats.moves, stats.moves)
+
+    def test_recursion_depth(self):
+        counted_merge_sort = instrumented(merge_sort)
+        counted_merge_sort(list(range(1024)))
+        self.assertEqual(counted_merge_sort.stats.max_depth, 11)
+        self.assertGreater(counted_merge_sort.stats.aux_bytes, 0)
+
+    def test_callback_and_key(self):
+        calls = []
+        records = [{"score": random.randint(0, 10)} for _ in range(100)]
+        result = instrumented(quick_sort, callback=calls.append)(
+            records.copy(), key=lambda record: record["score"])
+        self.assertEqual(result, sorted(records, key=lambda record: record["score"]))
+        self.assertIsInstance(calls[0], SortStats)
+        self.assertGreater(calls[0].compares, 0)
+
+    def test_selection(self):
+        arr = [random.randint(0, 1000) for _ in range(300)]
+        self.assertEqual(instrumented(quickselect)(arr.copy(), 10), sorted(arr)[10])
+        self.assertEqual(instrumented(top_k)(arr, 3), sorted(arr, reverse=True)[:3])
+
+
+class TestCutoffCalibration(unittest.TestCase):
+
+    def test_calibrate(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "cutoffs.json")
+            cutoffs = calibrate_cutoffs(sorts=("quick_sort",), element_types=("int", "str"),
+                                        candidates=(0, 8), size=200, repeats=1, path=path)
+            self.assertEqual(set(cutoffs["quick_sort"]), {"int", "str"})
+            self.assertIn(cutoffs["quick_sort"]["int"], (0, 8))
+            self.assertTrue(os.path.exists(path))
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_run(self):
+        results = benchmark.run(sorts=("merge_sort", "sorted"), sizes=(50,), repeats=3)
+        self.assertEqual(len(results), 2 * len(benchmark.DISTRIBUTIONS))
+        for result in results:
+            self.assertLessEqual(result["min"], result["median"])
+            self.assertLessEqual(result["median"], result["p95"])
+            self.assertGreater(result["compares"], 0)
+
+    def test_reproducible(self):
+        first = benchmark.run(sorts=("quick_sort",), distributions=("random",), sizes=(50,))
+        second = benchmark.run(sorts=("quick_sort",), distributions=("random",), sizes=(50,))
+        self.assertEqual(first[0]["compares"], second[0]["compares"])
+
+    def test_main_output(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "results.json")
+            benchmark.main(["sort", "--sorts", "merge_sort", "--distributions", "random",
+                            "--sizes", "50", "--repeats", "2", "--seed", "3",
+                            "--output", output_path])
+            with open(output_path) as output_file:
+                report = json.load(output_file)
+        self.assertEqual(report["seed"], 3)
+        self.assertEqual([result["sort"] for result in report["results"]], ["merge_sort"])
+
+
 if __name__ == "__main__":
     unittest.main()
 
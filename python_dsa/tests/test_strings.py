@@ -0,0 +1,122 @@
+from python_dsa.algorithms import strings
+from python_dsa.algorithms.strings import (Pattern, longest_repeating_substring, multi_search,
+                                           search, search_all)
+from python_dsa.algorithms.suffix_array import SuffixArray
+
+import os
+import random
+import unittest
+
+
+def _naive_search_all(text, pattern):
+    return [idx for idx in range(len(text) - len(pattern) + 1)
+            if text[idx : idx + len(pattern)] == pattern]
+
+
+class TestRabinKarp(unittest.TestCase):
+
+    def test_search(self):
+        for _ in range(200):
+            text = "".join(random.choices("ab", k=random.randint(0, 40)))
+            pattern = "".join(random.choices("ab", k=random.randint(1, 4)))
+            expected = _naive_search_all(text, pattern)
+            self.assertEqual(list(search_all(text, pattern)), expected)
+            self.assertEqual(search(text, pattern), expected[0] if expected else -1)
+
+    def test_alphabets(self):
+        self.assertEqual(search("naïve café ☕ done", "café ☕"), 6)
+        self.assertEqual(search(b"\x00\xff\x10\xff\x10", b"\xff\x10"), 1)
+        self.assertEqual(search(bytearray(b"abcabc"), b"ca"), 2)
+        self.assertEqual(search("abc", ""), 0)
+        self.assertEqual(search("ab", "abc"), -1)
+
+    def test_collisions_are_verified(self):
+        # With a radix of 1 every anagram hashes the same, so only verification tells them apart.
+        radix = strings._RADIX
+        strings._RADIX = 1
+        try:
+            self.assertEqual(list(search_all("abcbacabc", "abc")), [0, 6])
+            self.assertEqual(longest_repeating_substring("abcbca"), 2)
+        finally:
+            strings._RADIX = radix
+
+    def test_multi_search(self):
+        for _ in range(100):
+            text = "".join(random.choices("abc", k=random.randint(0, 60)))
+            patterns = ["".join(random.choices("abc", k=random.randint(1, 5))) for _ in range(6)]
+            expected = sorted((idx, pattern) for pattern in set(patterns)
+                              for idx in _naive_search_all(text, pattern))
+            found = list(multi_search(text, patterns))
+            self.assertEqual([idx for idx, _ in found], sorted(idx for idx, _ in found))
+            self.assertEqual(sorted(found), expected)
+
+    def test_longest_repeating_substring(self):
+        for _ in range(100):
+            s = "".join(random.choices("abc", k=random.randint(0, 20)))
+            expected = max((length for length in range(1, len(s))
+                            if any(s.find(s[idx : idx + length], idx + 1) != -1
+                                   for idx in range(len(s) - length + 1))), default=0)
+            self.assertEqual(longest_repeating_substring(s), expected)
+
+
+class TestPattern(unittest.TestCase):
+
+    def test_finditer(self):
+        for _ in range(200):
+            text = "".join(random.choices("ab", k=random.randint(0, 40)))
+            pattern = Pattern("".join(random.choices("ab", k=random.randint(0, 4))))
+            expected = _naive_search_all(text, pattern.pattern)
+            for algorithm in ("horspool", "kmp"):
+                self.assertEqual(list(pattern.finditer(text, algorithm)), expected)
+                self.assertEqual(pattern.search(text, algorithm), expected[0] if expected else -1)
+
+    def test_chunks(self):
+        for _ in range(200):
+            text = bytes(random.choices(b"abc", k=random.randint(0, 60)))
+            pattern = Pattern(bytes(random.choices(b"abc", k=random.randint(1, 5))))
+            size = random.randint(1, 7)
+            chunks = [text[idx : idx + size] for idx in range(0, len(text), size)]
+            expected = _naive_search_all(text, pattern.pattern)
+            for algorithm in ("horspool", "kmp"):
+                self.assertEqual(list(pattern.finditer_chunks(iter(chunks), algorithm)), expected)
+
+    def test_reuse(self):
+        pattern = Pattern("abab")
+        self.assertEqual(pattern.failure, [0, 0, 1, 2])
+        self.assertEqual(pattern.search("xxababab"), 2)
+        self.assertEqual(list(pattern.finditer("abababab", "kmp")), [0, 2, 4])
+        self.assertEqual(pattern.search("aba"), -1)
+        with self.assertRaises(ValueError):
+            pattern.search("abab", algorithm="naive")
+
+
+class TestSuffixArray(unittest.TestCase):
+
+    def test_suffixes(self):
+        for _ in range(100):
+            text = "".join(random.choices("ab", k=random.randint(0, 40)))
+            index = SuffixArray(text)
+            self.assertEqual(list(index.suffixes),
+                             sorted(range(len(text)), key=lambda idx: text[idx:]))
+            for position in range(1, len(text)):
+                first, second = (text[idx:] for idx in index.suffixes[position - 1 : position + 1])
+                self.assertEqual(index.lcp[position], len(os.path.commonprefix([first, second])))
+
+    def test_queries(self):
+        for _ in range(100):
+            text = bytes(random.choices(b"abc", k=random.randint(0, 60)))
+            index = SuffixArray(text)
+            for length in range(1, 4):
+                pattern = bytes(random.choices(b"abc", k=length))
+                expected = _naive_search_all(text, pattern)
+                self.assertEqual(index.locate(pattern), expected)
+                self.assertEqual(index.count(pattern), len(expected))
+
+            repeated = index.longest_repeated_substring()
+            self.assertEqual(len(repeated), longest_repeating_substring(text))
+            if repeated:
+                self.assertGreater(len(_naive_search_all(text, repeated)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
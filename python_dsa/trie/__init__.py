@@ -1,2 +1,2 @@
+from python_dsa.trie.aho_corasick import *
 from python_dsa.trie.trie import *
-
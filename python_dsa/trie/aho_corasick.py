@@ -0,0 +1,107 @@
+# Aho-Corasick automaton: a trie of keywords with failure links, matching all of them in one pass.
+from collections import deque
+
+from python_dsa.trie.trie import Trie
+
+
+class AhoCorasick(Trie):
+    """Trie that finds every occurrence of all of its keys in a text or stream in a single pass.
+
+    Each node gets a failure link to the node of the longest proper suffix of its key that is also
+    a prefix of some key, so on a mismatch the search falls back along the links instead of
+    restarting at the next offset. Matching takes O(n + number of matches) for a text of length n,
+    however many keys there are. The links are built on the first search after the keys change.
+    """
+
+    def __init__(self, keywords=()):
+        super().__init__()
+        self._failure = None
+        for key, val in dict(keywords).items():
+            self[key] = val
+
+    def __setitem__(self, key, val):
+        super().__setitem__(key, val)
+        self._failure = None
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._failure = None
+
+    def __repr__(self):
+        return f"AhoCorasick(radix={self.radix})"
+
+    # O(number of nodes * radix) time.
+    def _build(self):
+        """Add a failure link, key and nearest match along the failure links to every node."""
+        root = self._root
+        self._failure = {root: root}
+        self._key = {root: ""}
+        # The node itself if it holds a value, otherwise the first node along its failure links
+        # that does (or None), so every match ending at a position can be listed directly.
+        self._match = {root: None}
+
+        # Breadth first, so the failure link of a node is always to a shallower, finished node.
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            for idx, child in enumerate(node.children):
+                if not child:
+                    continue
+                self._key[child] = self._key[node] + chr(idx)
+
+                fallback = self._failure[node]
+                while fallback is not root and not fallback.children[idx]:
+                    fallback = self._failure[fallback]
+                if node is not root and fallback.children[idx]:
+                    self._failure[child] = fallback.children[idx]
+                else:
+                    self._failure[child] = root
+
+                self._match[child] = (child if child.value is not None
+                                      else self._match[self._failure[child]])
+                queue.append(child)
+
+    def finditer(self, text):
+        """Yield (offset, key, value) for every occurrence of every key in a str or bytes text."""
+        return self.finditer_chunks((text,))
+
+    def finditer_chunks(self, chunks):
+        """Yield (offset, key, value) for every key occurrence in a stream of str or bytes chunks.
+
+        offset is the index in the whole stream where the key starts, and matches that span chunk
+        boundaries are found. Matches are in order of where they end, then longest first.
+        """
+        if self._failure is None:
+            self._build()
+        root, failure, match, key_of = self._root, self._failure, self._match, self._key
+
+        node, end = root, 0
+        for chunk in chunks:
+            # Indexing bytes already gives an int.
+            codes = chunk if isinstance(chunk, (bytes, bytearray)) else map(ord, chunk)
+            for code in codes:
+                end += 1
+                if code >= self.radix:
+                    node = root
+                    continue
+                while node is not root and not node.children[code]:
+                    node = failure[node]
+                node = node.children[code] or root
+
+                found = match[node]
+                while found is not None:
+                    key = key_of[found]
+                    yield end - len(key), key, found.value
+                    found = match[failure[found]]
+
+
+if __name__ == "__main__":
+    automaton = AhoCorasick({"he": 1, "she": 2, "his": 3, "hers": 4})
+    print(list(automaton.finditer("ushers")))
+    print(list(automaton.finditer(b"this is his")))
+    print(list(automaton.finditer_chunks(["u", "sh", "ers"])))
+
+    automaton["us"] = 5
+    del automaton["he"]
+    print(list(automaton.finditer("ushers")))
+    print(automaton.longest_prefix("hersheys"))
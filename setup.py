@@ -12,4 +12,5 @@ setuptools.setup(
     description="Common data structures and algorithms in Python",
     packages=setuptools.find_packages(),
     install_requires=["handy_decorators==0.0.2"],
+    extras_require={"numpy": ["numpy"]},
 )